@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import heapq
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:  # orjson opsional — fallback ke json stdlib
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - tergantung environment
+    _loads = json.loads
+
 
 def _safe_float(value: Any, default: float = 0.0) -> float:
     try:
@@ -34,21 +41,50 @@ class RiskFeedbackCalibrator:
         self.vault_path = Path(vault_path)
         self.vault_path.mkdir(parents=True, exist_ok=True)
         self.confidence_weight: float = 1.0
+        # path -> (mtime_ns, payload); file yang tidak berubah tidak dibaca ulang
+        self._payload_cache: dict[str, tuple[int, dict[str, Any] | None]] = {}
+
+    def _scan_latest(self, limit: int) -> list[tuple[int, str]]:
+        """Satu pass scandir; hanya `limit` file terbaru (mtime) yang disimpan di heap."""
+
+        def entries():
+            with os.scandir(self.vault_path) as iterator:
+                for entry in iterator:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        if entry.is_file():
+                            yield entry.stat().st_mtime_ns, entry.path
+                    except OSError:
+                        continue
+
+        return heapq.nlargest(limit, entries())
 
     def load_risk_data(self, *, limit: int = 10) -> list[dict[str, Any]]:
-        files = sorted(
-            self.vault_path.glob("*.json"),
-            key=lambda path: path.stat().st_mtime,
-            reverse=True,
-        )
+        if limit <= 0:
+            return []
+        try:
+            latest = self._scan_latest(limit)
+        except OSError:
+            return []
+        cache = self._payload_cache
+        fresh: dict[str, tuple[int, dict[str, Any] | None]] = {}
         items: list[dict[str, Any]] = []
-        for path in files[:limit]:
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-                if isinstance(payload, dict):
-                    items.append(payload)
-            except (OSError, ValueError, json.JSONDecodeError):
-                continue
+        for mtime_ns, path in latest:
+            cached = cache.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                payload = cached[1]
+            else:
+                try:
+                    with open(path, "rb") as handle:
+                        decoded = _loads(handle.read())
+                except (OSError, ValueError):
+                    continue
+                payload = decoded if isinstance(decoded, dict) else None
+            fresh[path] = (mtime_ns, payload)
+            if payload is not None:
+                items.append(payload)
+        self._payload_cache = fresh
         return items
 
     def calibrate(
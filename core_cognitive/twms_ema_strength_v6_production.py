@@ -21,6 +21,7 @@ from core_meta.neural_connector_v6_production import (
     NeuralConnector,
     NeuralEventType,
     RepoMetadata,
+    install_uvloop,
 )
 from core_reflective.reflective_logger import log_reflective_event
 from server_api.services.cloud_logger_service import cloud_log_event
@@ -162,4 +163,5 @@ if __name__ == "__main__":
         print("FRPC Exported:", json.dumps(frpc, indent=2))
         await analyzer.stop()
 
+    install_uvloop()
     asyncio.run(run_test())
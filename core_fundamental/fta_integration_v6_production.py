@@ -12,6 +12,7 @@ from core_meta.neural_connector_v6_production import (
     NeuralConnector,
     NeuralEventType,
     RepoMetadata,
+    install_uvloop,
 )
 from core_reflective.reflective_logger import log_reflective_event
 from server_api.services.cloud_logger_service import cloud_log_event
@@ -182,4 +183,5 @@ if __name__ == "__main__":
         print("FTA Result:", json.dumps(result, indent=2))
         await engine.stop()
 
+    install_uvloop()
     asyncio.run(run_demo())
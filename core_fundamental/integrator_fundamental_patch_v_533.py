@@ -19,6 +19,7 @@ from core_meta.neural_connector_v6_production import (
     NeuralConnector,
     NeuralEventType,
     RepoMetadata,
+    install_uvloop,
 )
 
 
@@ -283,4 +284,5 @@ if __name__ == "__main__":
         print(json.dumps(patch_block, indent=2))
         await integrator.stop()
 
+    install_uvloop()
     asyncio.run(run_demo())
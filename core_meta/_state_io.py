@@ -0,0 +1,283 @@
+"""
+State I/O helper untuk modul REE / Neural Hub.
+----------------------------------------
+Penulisan snapshot state JSON secara atomik (tmp + os.replace) sehingga
+pembaca tidak pernah melihat file terpotong. Snapshot yang byte-nya identik
+dengan tulisan terakhir ke path yang sama dilewati (dirty-check). Digest
+disimpan untuk paling banyak 256 path terakhir (LRU), sehingga path sekali
+tulis (mis. journal per siklus) tidak menumpuk selama proses hidup.
+
+Direktori target dibuat dan dibuka (dirfd) sekali per proses; file ditulis
+relatif terhadap dirfd tersebut (openat/renameat) sehingga kernel tidak
+perlu menelusuri ulang seluruh path di setiap tulisan.
+
+`STATE_SINK` memindahkan tulisan keluar dari jalur siklus REE: snapshot
+di-serialize di caller, lalu ditulis oleh satu thread latar belakang.
+Snapshot yang belum sempat ditulis untuk path yang sama digantikan oleh
+yang terbaru. Record JSONL (append) dikumpulkan per file dan ditulis dengan
+satu writev per batch. Antrian di-flush saat interpreter keluar (dengan
+batas waktu, agar shutdown tidak pernah menggantung). Thread sink dibuat
+ulang bila mati atau setelah fork(); di proses anak antrian milik parent
+dibuang (parent yang menulisnya). Set env
+`REE_IO_CPU=<n>` untuk mem-pin thread sink ke CPU tertentu (Linux) agar
+tidak berpindah ke core yang menjalankan kalkulasi REE.
+
+Dependensi opsional:
+- orjson: serialisasi snapshot (fallback: json stdlib, format indent=2 sama)
+- xxhash: digest 64-bit untuk dirty-check (fallback: hash() builtin)
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+try:  # orjson opsional — fallback ke json stdlib
+    import orjson
+except ImportError:  # pragma: no cover - tergantung environment
+    orjson = None
+
+try:  # xxhash opsional — hash() builtin cukup karena digest hanya dipakai in-process
+    from xxhash import xxh64_intdigest as _digest
+except ImportError:  # pragma: no cover - tergantung environment
+    _digest = hash
+
+_LOG = logging.getLogger(__name__)
+# path → digest tulisan terakhir (LRU, dibatasi _DIGEST_LIMIT entri)
+_LAST_DIGEST: "OrderedDict[str, int]" = OrderedDict()
+_DIGEST_LIMIT = 256
+_DIGEST_LOCK = threading.Lock()
+_DIR_FDS: Dict[str, int] = {}
+_DIR_FDS_LOCK = threading.Lock()
+_USE_DIR_FD = os.open in os.supports_dir_fd and os.replace in os.supports_dir_fd
+# Batas operasi file bersamaan (siklus REE paralel per pair/timeframe)
+_FILE_POOL = threading.BoundedSemaphore(32)
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0)
+_IOV_MAX = 1024
+# Batas tunggu default `AsyncJsonSink.flush` (detik)
+_FLUSH_TIMEOUT = 10.0
+
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+    def _encode(data: Any) -> bytes:
+        return orjson.dumps(data, option=_ORJSON_OPTS)
+
+    def _encode_line(data: Any) -> bytes:
+        return orjson.dumps(
+            data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        )
+
+else:
+
+    def _encode(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def _encode_line(data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8") + b"\n"
+
+
+def _dir_fd(directory: str) -> int:
+    """dirfd (cached) untuk `directory`; dibuat bila belum ada."""
+    key = os.path.abspath(directory)
+    fd = _DIR_FDS.get(key)
+    if fd is None:
+        with _DIR_FDS_LOCK:
+            fd = _DIR_FDS.get(key)
+            if fd is None:
+                os.makedirs(key, exist_ok=True)
+                fd = os.open(key, os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_CLOEXEC", 0))
+                _DIR_FDS[key] = fd
+    return fd
+
+
+def _digest_unchanged(path: str, digest: int) -> bool:
+    with _DIGEST_LOCK:
+        if _LAST_DIGEST.get(path) != digest:
+            return False
+        _LAST_DIGEST.move_to_end(path)
+        return True
+
+
+def _remember_digest(path: str, digest: int) -> None:
+    with _DIGEST_LOCK:
+        _LAST_DIGEST[path] = digest
+        _LAST_DIGEST.move_to_end(path)
+        if len(_LAST_DIGEST) > _DIGEST_LIMIT:
+            _LAST_DIGEST.popitem(last=False)
+
+
+def _write_bytes_atomic(path: str, buf: bytes) -> bool:
+    digest = _digest(buf)
+    if _digest_unchanged(path, digest):
+        return False
+    directory, name = os.path.split(path)
+    tmp = f"{name}.{os.getpid()}.tmp"
+    with _FILE_POOL:
+        if _USE_DIR_FD:
+            dfd = _dir_fd(directory or ".")
+            fd = os.open(tmp, _OPEN_FLAGS, 0o644, dir_fd=dfd)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
+            os.replace(tmp, name, src_dir_fd=dfd, dst_dir_fd=dfd)
+        else:  # pragma: no cover - platform tanpa dir_fd (mis. Windows)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = os.path.join(directory, tmp)
+            fd = os.open(tmp, _OPEN_FLAGS, 0o644)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
+    _remember_digest(path, digest)
+    return True
+
+
+def _append_lines(path: str, bufs: List[bytes]) -> None:
+    directory, name = os.path.split(path)
+    with _FILE_POOL:
+        if _USE_DIR_FD:
+            fd = os.open(name, _APPEND_FLAGS, 0o644, dir_fd=_dir_fd(directory or "."))
+        else:  # pragma: no cover - platform tanpa dir_fd (mis. Windows)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            fd = os.open(path, _APPEND_FLAGS, 0o644)
+        try:
+            for start in range(0, len(bufs), _IOV_MAX):
+                os.writev(fd, bufs[start:start + _IOV_MAX])
+        finally:
+            os.close(fd)
+
+
+def write_json_atomic(path: str, data: Any) -> bool:
+    """
+    Tulis `data` sebagai JSON (indent=2) ke `path` via tmp + os.replace.
+    Return False bila isi tidak berubah sejak tulisan terakhir (write dilewati).
+    """
+    return _write_bytes_atomic(path, _encode(data))
+
+
+def _pin_io_thread() -> None:
+    """Pin thread pemanggil ke CPU `REE_IO_CPU` bila diset (diam bila tidak didukung)."""
+    cpu = os.environ.get("REE_IO_CPU")
+    if not cpu or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        # pid 0 = thread pemanggil (Linux), bukan seluruh proses
+        os.sched_setaffinity(0, {int(cpu)})
+    except (ValueError, OSError) as exc:
+        _LOG.warning("REE_IO_CPU=%s diabaikan: %s", cpu, exc)
+
+
+class AsyncJsonSink:
+    """
+    Write-back sink bersama untuk semua persister REE.
+    Snapshot: latest-wins per path. Append: FIFO per path, satu writev per batch.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, bytes] = {}
+        self._appends: Dict[str, List[bytes]] = {}
+        self._cond = threading.Condition()
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+
+    def submit(self, path: str, data: Any) -> bool:
+        """
+        Serialize `data` sekarang, tulis ke `path` di thread sink.
+        Return False bila snapshot identik dengan yang terakhir tertulis.
+        """
+        buf = _encode(data)
+        with self._cond:
+            if path not in self._pending and _digest_unchanged(path, _digest(buf)):
+                return False
+            self._pending[path] = buf
+            self._wake()
+        return True
+
+    def append(self, path: str, record: Any) -> None:
+        """Tambahkan `record` sebagai satu baris JSON ke `path` (JSONL)."""
+        buf = _encode_line(record)
+        with self._cond:
+            self._appends.setdefault(path, []).append(buf)
+            self._wake()
+
+    def flush(self, timeout: Optional[float] = _FLUSH_TIMEOUT) -> bool:
+        """
+        Blok sampai semua snapshot/record yang sudah di-submit tertulis.
+        Return False bila `timeout` (detik, None = tanpa batas) habis lebih dulu.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._pending or self._appends:
+                self._wake()
+            while self._pending or self._appends or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    _LOG.warning("State sink flush timeout (%.1fs)", timeout)
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _reset_after_fork(self) -> None:
+        # proses anak: lock/thread warisan parent tidak valid; antrian milik parent
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._appends = {}
+        self._busy = False
+        self._thread = None
+        self._pid = os.getpid()
+
+    def _wake(self) -> None:
+        # dipanggil dengan self._cond terkunci
+        if self._pid != os.getpid():  # pragma: no cover - fork tanpa register_at_fork
+            self._pid = os.getpid()
+            self._thread = None
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="ree-state-sink", daemon=True
+            )
+            self._thread.start()
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        _pin_io_thread()
+        while True:
+            with self._cond:
+                while not self._pending and not self._appends:
+                    self._cond.wait()
+                batch, self._pending = self._pending, {}
+                appends, self._appends = self._appends, {}
+                self._busy = True
+            try:
+                # Exception apa pun per item dicatat lalu dilewati; thread tetap hidup
+                for path, bufs in appends.items():
+                    try:
+                        _append_lines(path, bufs)
+                    except Exception:
+                        _LOG.exception("State sink gagal append %s (%d record)", path, len(bufs))
+                for path, buf in batch.items():
+                    try:
+                        _write_bytes_atomic(path, buf)
+                    except Exception:
+                        _LOG.exception("State sink gagal menulis %s", path)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+STATE_SINK = AsyncJsonSink()
+atexit.register(STATE_SINK.flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=STATE_SINK._reset_after_fork)
@@ -7,12 +7,13 @@ Controls full Reflective Evolution Engine (REE) cycle:
 """
 
 import json
-import os
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict
 
 from core_reflective.reflective_logger import ReflectiveLogger
+from core_meta._state_io import STATE_SINK
 from core_meta.ree_feedback_interface import REEFeedbackInterface
 from core_meta.ree_integrity_controller import REEIntegrityController
 from core_meta.ree_field_resonance_mapper import REEFieldResonanceMapper
@@ -20,6 +21,12 @@ from core_meta.ree_cloud_sync import REECloudSync
 from core_meta.ree_adaptive_analysis import REEAdaptiveAnalysis
 
 
+@lru_cache(maxsize=1)
+def _get_mapper() -> REEFieldResonanceMapper:
+	"""Mapper resonansi stateless — cukup satu instance per proses."""
+	return REEFieldResonanceMapper()
+
+
 class MetaLearningDriver:
 	"""
 	🧬 Meta-Learning Reflective Cycle Driver
@@ -31,7 +38,7 @@ class MetaLearningDriver:
 		self.logger = ReflectiveLogger("MetaLearningDriver")
 		self.feedback = REEFeedbackInterface()
 		self.integrity = REEIntegrityController()
-		self.resonance = REEFieldResonanceMapper()
+		self.resonance = _get_mapper()
 		self.cloud = REECloudSync()
 		self.analyzer = REEAdaptiveAnalysis()
 
@@ -137,7 +144,6 @@ class MetaLearningDriver:
 		integrity_result: Dict[str, Any],
 	) -> None:
 		"""Save full meta learning cycle result to Journal Vault."""
-		os.makedirs("data/journals", exist_ok=True)
 		path = f"data/journals/meta_cycle_{self.meta_state['cycle_id']}.json"
 
 		meta_log = {
@@ -160,8 +166,8 @@ class MetaLearningDriver:
 			},
 		}
 
-		with open(path, "w", encoding="utf-8") as f:
-			json.dump(meta_log, f, indent=2)
+		# Di-serialize sekali di sini, ditulis sink latar belakang dalam satu write
+		STATE_SINK.submit(path, meta_log)
 
 		self.logger.log(f"Meta-Learning Cycle Log saved to {path}")
 
@@ -7,10 +7,12 @@ and Quad Vault System through hybrid neural channels.
 """
 
 import json
-import os
 from datetime import datetime
 from typing import Any, Dict
 
+import numpy as np
+
+from core_meta._state_io import STATE_SINK
 from core_meta.neural_connector_v6_production import NeuralConnectorV6
 from core_reflective.hybrid_reflective_bridge_manager import HybridReflectiveBridgeManager
 from core_reflective.reflective_logger import ReflectiveLogger
@@ -34,6 +36,9 @@ class NeuralBridgeHubV6:
             "integrity_index": 0.0,
             "meta_feedback_linked": False,
         }
+        # Bobot coherence: [connector, bridge]; integrity: [bridge, meta]
+        self._coh_w = np.array([0.6, 0.4])
+        self._int_w = np.array([0.5, 0.5])
 
     # ------------------------------------------------------------
     # 🧩 INITIALIZATION
@@ -67,14 +72,13 @@ class NeuralBridgeHubV6:
         connector_sync = self.connector.run_reflective_sync()
         bridge_sync = self.bridge_manager.sync_all()
 
+        bridge_coherence = bridge_sync["coherence_index"]
         coherence_index = round(
-            (connector_sync["coherence_index"] * 0.6)
-            + (bridge_sync["coherence_index"] * 0.4),
+            float(self._coh_w @ (connector_sync["coherence_index"], bridge_coherence)),
             3,
         )
         integrity_index = round(
-            (bridge_sync["coherence_index"] * 0.5)
-            + (connector_sync["meta_integrity"] * 0.5),
+            float(self._int_w @ (bridge_coherence, connector_sync["meta_integrity"])),
             3,
         )
 
@@ -96,6 +100,18 @@ class NeuralBridgeHubV6:
             "timestamp": self.state["last_sync"],
         }
 
+    def run_full_sync_batch(self, shards: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized coherence/integrity for N shards at once.
+        `shards` is (N, 3): [connector_coherence, bridge_coherence, meta_integrity].
+        Does not touch hub state or persist anything.
+        """
+        shards = np.asarray(shards, dtype=float)
+        return {
+            "coherence_index": (shards[:, :2] @ self._coh_w).round(3),
+            "integrity_index": (shards[:, 1:] @ self._int_w).round(3),
+        }
+
     # ------------------------------------------------------------
     # 🧠 META–REFLECTIVE FEEDBACK DISTRIBUTION
     # ------------------------------------------------------------
@@ -121,11 +137,9 @@ class NeuralBridgeHubV6:
     # ------------------------------------------------------------
     def _save_state(self) -> None:
         """Persist neural bridge hub state to JSON file."""
-        os.makedirs("data/integrity", exist_ok=True)
         path = "data/integrity/neural_bridge_hub_state.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, indent=2)
-        self.logger.log(f"Neural Bridge Hub state saved to {path}")
+        if STATE_SINK.submit(path, self.state):
+            self.logger.log(f"Neural Bridge Hub state saved to {path}")
 
 
 # ------------------------------------------------------------
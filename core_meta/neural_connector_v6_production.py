@@ -6,11 +6,21 @@ Fungsi:
 - Sinkronisasi real-time antar repo reflective intelligence
 - Mendukung reflective broadcast: Fusion, FTA, REE, Vault
 - Auto-register ke Quad Vault neural registry
+
+Dependensi opsional:
+- msgspec: decode event masuk tanpa validasi Pydantic per pesan
+- orjson: encode envelope event di jalur publish
+- uvloop>=0.19: event loop berbasis libuv untuk listener + heartbeat
+  (opt-in lewat `install_uvloop()` di entry point pemilik loop)
 """
 
 import asyncio
+import atexit
+import json
 import logging
-import uuid
+import logging.handlers
+import os
+import queue
 from datetime import datetime
 from enum import Enum
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
@@ -18,6 +28,21 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 import redis.asyncio as redis
 from pydantic import BaseModel, Field
 
+try:  # msgspec opsional — fallback ke Pydantic bila tidak terpasang
+    import msgspec
+except ImportError:  # pragma: no cover - tergantung environment
+    msgspec = None
+
+try:  # orjson opsional — fallback ke json stdlib
+    import orjson
+except ImportError:  # pragma: no cover - tergantung environment
+    orjson = None
+
+try:  # uvloop opsional — loop asyncio default tetap dipakai bila tidak ada
+    import uvloop
+except ImportError:  # pragma: no cover - tergantung environment
+    uvloop = None
+
 
 class NeuralEventType(str, Enum):
     """Jenis sinyal dalam jaringan TUYUL Reflective Network."""
@@ -57,8 +82,26 @@ class RepoMetadata(BaseModel):
     last_heartbeat: datetime = Field(default_factory=datetime.utcnow)
 
 
+def install_uvloop() -> bool:
+    """
+    Pasang uvloop sebagai event loop policy bila tersedia.
+
+    Mengganti policy untuk seluruh proses — panggil hanya dari entry point
+    yang memiliki loop (sebelum `asyncio.run`), bukan saat import modul.
+    """
+    if uvloop is None:
+        return False
+    uvloop.install()
+    return True
+
+
+def _new_event_id() -> str:
+    """ID event acak 96-bit (hex) — cukup unik untuk skala event neural."""
+    return os.urandom(12).hex()
+
+
 class NeuralEvent(BaseModel):
-    event_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = Field(default_factory=_new_event_id)
     event_type: NeuralEventType
     source_repo_id: str
     target_repo_id: Optional[str] = None
@@ -68,6 +111,153 @@ class NeuralEvent(BaseModel):
     ttl: int = 300
 
 
+if msgspec is not None:
+
+    class NeuralEventMsg(msgspec.Struct, kw_only=True):
+        """Mirror ringan NeuralEvent untuk jalur decode listener."""
+
+        event_id: Union[str, msgspec.UnsetType] = msgspec.UNSET
+        event_type: NeuralEventType
+        source_repo_id: str
+        target_repo_id: Optional[str] = None
+        timestamp: Union[datetime, msgspec.UnsetType] = msgspec.UNSET
+        payload: Dict[str, Any]
+        correlation_id: Optional[str] = None
+        ttl: int = 300
+
+    _EVENT_DECODER = msgspec.json.Decoder(NeuralEventMsg)
+
+    def _decode_event(data: Union[str, bytes]) -> NeuralEvent:
+        # msgspec sudah memvalidasi skema; NeuralEvent dibangun tanpa validasi
+        # ulang agar handler selalu menerima model Pydantic, apa pun backend-nya.
+        msg = _EVENT_DECODER.decode(data)
+        fields = {
+            name: value
+            for name in msg.__struct_fields__
+            if (value := getattr(msg, name)) is not msgspec.UNSET
+        }
+        return NeuralEvent.model_construct(**fields)
+
+else:
+
+    def _decode_event(data: Union[str, bytes]) -> NeuralEvent:
+        return NeuralEvent.model_validate_json(data)
+
+
+if orjson is not None:
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_event(
+    event_type: NeuralEventType,
+    source_repo_id: str,
+    payload: Dict[str, Any],
+    target_repo_id: Optional[str] = None,
+    correlation_id: Optional[str] = None,
+) -> bytes:
+    """
+    Encoder envelope khusus NeuralEvent (field ditulis langsung, urutan skema)
+    — menggantikan NeuralEvent(...).model_dump_json() di jalur publish.
+    """
+    return _dumps({
+        "event_id": os.urandom(12).hex(),
+        "event_type": getattr(event_type, "value", event_type),
+        "source_repo_id": source_repo_id,
+        "target_repo_id": target_repo_id,
+        "timestamp": datetime.utcnow().isoformat(),
+        "payload": payload,
+        "correlation_id": correlation_id,
+        "ttl": 300,
+    })
+
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize payload sekali untuk `NeuralConnector.publish_raw`."""
+    return _dumps(payload)
+
+
+def _encode_event_raw(
+    event_type: NeuralEventType,
+    source_repo_id: str,
+    payload_json: bytes,
+    target_repo_id: Optional[str] = None,
+    correlation_id: Optional[str] = None,
+) -> bytes:
+    """Seperti `_encode_event`, tetapi payload sudah berupa JSON (disisipkan apa adanya)."""
+    head = _dumps({
+        "event_id": os.urandom(12).hex(),
+        "event_type": getattr(event_type, "value", event_type),
+        "source_repo_id": source_repo_id,
+        "target_repo_id": target_repo_id,
+        "timestamp": datetime.utcnow().isoformat(),
+    })
+    tail = _dumps({"correlation_id": correlation_id, "ttl": 300})
+    return b"".join((head[:-1], b',"payload":', payload_json, b",", tail[1:]))
+
+
+# Logging hot-path hanya enqueue record; format + I/O dikerjakan thread listener.
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+def _ensure_log_listener() -> None:
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        return
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s | 🧠 %(message)s"))
+    _LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, stream)
+    _LOG_LISTENER.start()
+    atexit.register(_LOG_LISTENER.stop)
+
+
+# Satu client Redis (connection pool) per URL dibagi semua konektor dalam
+# proses; ditutup saat konektor terakhir disconnect. Pool blocking: saat 64
+# koneksi terpakai (termasuk koneksi pubsub listener), pemanggil menunggu
+# koneksi kembali hingga _POOL_TIMEOUT detik, bukan langsung "Too many connections".
+_POOL_MAX_CONNECTIONS = 64
+_POOL_TIMEOUT = 20.0
+_CLIENT_CACHE: Dict[str, redis.Redis] = {}
+_CLIENT_REFS: Dict[str, int] = {}
+
+
+def _acquire_client(url: str) -> redis.Redis:
+    client = _CLIENT_CACHE.get(url)
+    if client is None:
+        pool = redis.BlockingConnectionPool.from_url(
+            url,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=_POOL_MAX_CONNECTIONS,
+            timeout=_POOL_TIMEOUT,
+            health_check_interval=30,
+        )
+        client = redis.Redis(connection_pool=pool)
+        _CLIENT_CACHE[url] = client
+    _CLIENT_REFS[url] = _CLIENT_REFS.get(url, 0) + 1
+    return client
+
+
+async def _release_client(url: str) -> None:
+    refs = _CLIENT_REFS.get(url, 0) - 1
+    if refs > 0:
+        _CLIENT_REFS[url] = refs
+        return
+    _CLIENT_REFS.pop(url, None)
+    client = _CLIENT_CACHE.pop(url, None)
+    if client is not None:
+        await client.close()
+        # pool dibuat di sini (bukan oleh Redis()), jadi close() tidak memutusnya
+        await client.connection_pool.disconnect()
+
+
 Handler = Callable[[NeuralEvent], Union[Awaitable[Any], Any]]
 
 
@@ -92,25 +282,29 @@ class NeuralConnector:
         self.handlers: Dict[NeuralEventType, List[Handler]] = {}
         self.is_running = False
         self.tasks: List[asyncio.Task] = []
+        self._meta_json: Optional[str] = None
+        # Nama channel/key dibangun sekali; publish cukup concat untuk target.
+        self._broadcast_channel = f"{channel_prefix}:broadcast"
+        self._directed_channel_prefix = f"{channel_prefix}:repo:"
+        self._own_channel = self._directed_channel_prefix + repo_metadata.repo_id
+        self._registry_key = f"{channel_prefix}:registry:{repo_metadata.repo_id}"
+        self._heartbeat_key = f"{channel_prefix}:heartbeat:{repo_metadata.repo_id}"
 
     def _setup_logger(self) -> logging.Logger:
         logger = logging.getLogger(f"neural.{self.meta.repo_name}")
-        handler = logging.StreamHandler()
-        handler.setFormatter(logging.Formatter("%(asctime)s | 🧠 %(message)s"))
-        logger.addHandler(handler)
+        if not logger.handlers:
+            _ensure_log_listener()
+            logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
         logger.setLevel(logging.INFO)
         return logger
 
     async def connect(self) -> None:
         """Connect ke jaringan neural TUYUL."""
-        self.redis_client = await redis.from_url(
-            self.redis_url, encoding="utf-8", decode_responses=True
-        )
+        # Metadata tidak berubah setelah konstruksi — serialisasi sekali saja.
+        self._meta_json = self.meta.model_dump_json()
+        self.redis_client = _acquire_client(self.redis_url)
         self.pubsub = self.redis_client.pubsub()
-        await self.pubsub.subscribe(
-            f"{self.channel_prefix}:broadcast",
-            f"{self.channel_prefix}:repo:{self.meta.repo_id}",
-        )
+        await self.pubsub.subscribe(self._broadcast_channel, self._own_channel)
         self.is_running = True
         await self._register_repo()
         self.tasks = [
@@ -129,7 +323,8 @@ class NeuralConnector:
             await self.pubsub.unsubscribe()
             await self.pubsub.close()
         if self.redis_client:
-            await self.redis_client.close()
+            self.redis_client = None
+            await _release_client(self.redis_url)
         self.logger.info("🛑 Disconnected: %s", self.meta.repo_name)
 
     async def publish(
@@ -141,18 +336,35 @@ class NeuralConnector:
         """Kirim event ke jaringan."""
         if not self.redis_client:
             raise RuntimeError("Redis client belum terhubung.")
-        event = NeuralEvent(
-            event_type=event_type,
-            source_repo_id=self.meta.repo_id,
-            payload=payload,
-            target_repo_id=target_repo_id,
+        channel = (
+            self._broadcast_channel
+            if not target_repo_id
+            else self._directed_channel_prefix + target_repo_id
+        )
+        await self.redis_client.publish(
+            channel,
+            _encode_event(event_type, self.meta.repo_id, payload, target_repo_id),
         )
+        self.logger.info("📡 Published %s to %s", event_type, channel)
+
+    async def publish_raw(
+        self,
+        event_type: NeuralEventType,
+        payload_json: bytes,
+        target_repo_id: Optional[str] = None,
+    ) -> None:
+        """Kirim event dengan payload yang sudah di-serialize (lihat `encode_payload`)."""
+        if not self.redis_client:
+            raise RuntimeError("Redis client belum terhubung.")
         channel = (
-            f"{self.channel_prefix}:broadcast"
+            self._broadcast_channel
             if not target_repo_id
-            else f"{self.channel_prefix}:repo:{target_repo_id}"
+            else self._directed_channel_prefix + target_repo_id
+        )
+        await self.redis_client.publish(
+            channel,
+            _encode_event_raw(event_type, self.meta.repo_id, payload_json, target_repo_id),
         )
-        await self.redis_client.publish(channel, event.model_dump_json())
         self.logger.info("📡 Published %s to %s", event_type, channel)
 
     def on(
@@ -177,9 +389,10 @@ class NeuralConnector:
         """Daftarkan repo ke neural registry (Quad Vault awareness)."""
         if not self.redis_client:
             raise RuntimeError("Redis client belum terhubung.")
-        key = f"{self.channel_prefix}:registry:{self.meta.repo_id}"
         await self.redis_client.set(
-            key, self.meta.model_dump_json(), ex=self.heartbeat_interval * 5
+            self._registry_key,
+            self._meta_json or self.meta.model_dump_json(),
+            ex=self.heartbeat_interval * 5,
         )
         await self.publish(
             NeuralEventType.REPO_REGISTERED,
@@ -193,7 +406,7 @@ class NeuralConnector:
                 self.logger.error("Redis client tidak tersedia untuk heartbeat.")
                 break
             await self.redis_client.set(
-                f"{self.channel_prefix}:heartbeat:{self.meta.repo_id}",
+                self._heartbeat_key,
                 datetime.utcnow().isoformat(),
                 ex=self.heartbeat_interval * 3,
             )
@@ -218,17 +431,30 @@ class NeuralConnector:
 
     async def _dispatch_event(self, data: str) -> None:
         try:
-            event = NeuralEvent.model_validate_json(data)
+            event = _decode_event(data)
         except Exception as exc:
             self.logger.error("❌ Listener error: %s", exc)
             return
         if event.source_repo_id == self.meta.repo_id:
             return
-        handlers = self.handlers.get(event.event_type, [])
-        for handler in handlers:
-            result = handler(event)
-            if asyncio.iscoroutine(result):
-                await result
+        # Handler dipanggil sesuai urutan registrasi; coroutine yang dihasilkan
+        # dijalankan bersamaan. Error handler tetap diteruskan ke pemanggil,
+        # tetapi baru setelah coroutine yang sudah dibuat selesai berjalan.
+        pending: List[Awaitable[Any]] = []
+        try:
+            for handler in self.handlers.get(event.event_type, ()):
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    pending.append(result)
+        except Exception:
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+        if not pending:
+            return
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def _await_tasks(self) -> None:
         if not self.tasks:
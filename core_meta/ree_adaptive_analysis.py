@@ -7,13 +7,19 @@ and updates adaptive learning coefficients for reflective AI.
 """
 
 import json
-import os
 import random
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import numpy as np
+
+from core_meta._ree_kernels import drift_coherence_kernel, stability_factor_kernel
+from core_meta._state_io import STATE_SINK
 from core_reflective.reflective_logger import ReflectiveLogger
 
+# Batas simetris drift α, β, γ (sama dengan compute_reflective_drift)
+_DRIFT_BOUNDS = np.array([0.015, 0.012, 0.018])
+
 
 class REEAdaptiveAnalysis:
     """
@@ -34,6 +40,7 @@ class REEAdaptiveAnalysis:
             "adaptive_weight_beta": 0.33,
             "adaptive_weight_gamma": 0.34,
         }
+        self._rng: Optional[np.random.Generator] = None
 
     # ------------------------------------------------------------
     # 🧩 COMPUTE REFLECTIVE DRIFT
@@ -68,6 +75,22 @@ class REEAdaptiveAnalysis:
         self._save_analysis_state()
         return self.state
 
+    def compute_reflective_drift_many(self, n: int) -> Dict[str, np.ndarray]:
+        """
+        Drift sweep untuk N sampel sekaligus (Monte-Carlo per pair/timeframe).
+        Tidak mengubah state dan tidak menyimpan file.
+        """
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        drifts = self._rng.uniform(-_DRIFT_BOUNDS, _DRIFT_BOUNDS, size=(n, 3)).round(4)
+        return {
+            "alpha_drift": drifts[:, 0],
+            "beta_drift": drifts[:, 1],
+            "gamma_drift": drifts[:, 2],
+            "reflective_coherence": drift_coherence_kernel(drifts).round(3),
+            "stability_factor": stability_factor_kernel(drifts),
+        }
+
     # ------------------------------------------------------------
     # 🧠 ADAPTIVE LEARNING WEIGHT CALCULATION
     # ------------------------------------------------------------
@@ -111,18 +134,15 @@ class REEAdaptiveAnalysis:
     # ------------------------------------------------------------
     def _save_analysis_state(self) -> None:
         """Save drift analysis results."""
-        os.makedirs("data/integrity", exist_ok=True)
         path = "data/integrity/ree_adaptive_drift_state.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, indent=2)
-        self.logger.log(f"Adaptive drift state saved to {path}")
+        if STATE_SINK.submit(path, self.state):
+            self.logger.log(f"Adaptive drift state saved to {path}")
 
     def _save_adaptive_weights(self) -> None:
         """Save updated adaptive weights."""
         path = "data/integrity/ree_adaptive_weights.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, indent=2)
-        self.logger.log(f"Adaptive learning weights saved to {path}")
+        if STATE_SINK.submit(path, self.state):
+            self.logger.log(f"Adaptive learning weights saved to {path}")
 
 
 # ------------------------------------------------------------
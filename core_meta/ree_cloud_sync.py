@@ -13,6 +13,9 @@ import time
 from datetime import datetime
 from typing import Any, Dict
 
+import numpy as np
+
+from core_meta._state_io import STATE_SINK
 from core_reflective.reflective_logger import ReflectiveLogger
 
 
@@ -31,6 +34,8 @@ class REECloudSync:
 			"cloud_integrity": 0.0,
 			"sync_latency_ms": 0,
 		}
+		# Bobot integrity: [meta_integrity, reflective_coherence, harmonic_alignment]
+		self._integrity_w = np.array([0.5, 0.3, 0.2])
 
 	# ------------------------------------------------------------
 	# 🧩 INITIALIZATION
@@ -67,9 +72,14 @@ class REECloudSync:
 		latency_ms = round((time.time() - start_time) * 1000, 2)
 
 		cloud_integrity = round(
-			(payload["meta_integrity"] * 0.5)
-			+ (payload["reflective_coherence"] * 0.3)
-			+ (payload["harmonic_alignment"] * 0.2),
+			float(
+				self._integrity_w
+				@ (
+					payload["meta_integrity"],
+					payload["reflective_coherence"],
+					payload["harmonic_alignment"],
+				)
+			),
 			3,
 		)
 
@@ -118,9 +128,8 @@ class REECloudSync:
 	def _save_cloud_state(self, data: Dict[str, Any]) -> None:
 		"""Persist cloud sync payload & integrity data."""
 		path = "data/cloud_sync/ree_cloud_state.json"
-		with open(path, "w", encoding="utf-8") as f:
-			json.dump(data, f, indent=2)
-		self.logger.log(f"Cloud sync state saved to {path}")
+		if STATE_SINK.submit(path, data):
+			self.logger.log(f"Cloud sync state saved to {path}")
 
 
 # ------------------------------------------------------------
@@ -8,13 +8,39 @@ and feedback propagation to bridge layers.
 """
 
 import json
-import os
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from core_meta._ree_kernels import learning_gain_kernel
+from core_meta._state_io import STATE_SINK
 from core_reflective.reflective_logger import ReflectiveLogger
 
 
+@dataclass(slots=True)
+class REEState:
+    """State reflektif REE (dibaca/ditulis setiap siklus)."""
+
+    initialized: bool = False
+    reflective_coherence: float = 0.0
+    meta_integrity: float = 0.0
+    alpha_drift: float = 0.0
+    beta_drift: float = 0.0
+    gamma_drift: float = 0.0
+    timestamp: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "initialized": self.initialized,
+            "reflective_coherence": self.reflective_coherence,
+            "meta_integrity": self.meta_integrity,
+            "alpha_drift": self.alpha_drift,
+            "beta_drift": self.beta_drift,
+            "gamma_drift": self.gamma_drift,
+            "timestamp": self.timestamp,
+        }
+
+
 class REEFeedbackInterface:
     """
     🧠 Reflective Evolution Engine (REE) Feedback Interface
@@ -23,21 +49,16 @@ class REEFeedbackInterface:
 
     def __init__(self) -> None:
         self.logger = ReflectiveLogger("REEFeedbackInterface")
-        self.state: Dict[str, Any] = {
-            "initialized": False,
-            "reflective_coherence": 0.0,
-            "meta_integrity": 0.0,
-            "alpha_drift": 0.0,
-            "beta_drift": 0.0,
-            "gamma_drift": 0.0,
-        }
+        self.state = REEState()
+        # Timestamp siklus collect → compute (satu clock read per siklus)
+        self._cycle_ts: Optional[str] = None
 
     # ------------------------------------------------------------
     # 🧩 INITIALIZATION
     # ------------------------------------------------------------
     def initialize(self) -> Dict[str, Any]:
         """Initialize feedback interface."""
-        self.state["initialized"] = True
+        self.state.initialized = True
         self.logger.log("REE Feedback Interface initialized successfully.")
         return {"status": "initialized"}
 
@@ -50,15 +71,22 @@ class REEFeedbackInterface:
         Simulated data or read from Journal Vault in runtime mode.
         """
         self.logger.log("Collecting Reflective Feedback from active layers...")
+        self._cycle_ts = datetime.utcnow().isoformat()
         feedback = {
             "reflective_coherence": 0.942,
             "meta_integrity": 0.956,
             "alpha_drift": 0.012,
             "beta_drift": -0.006,
             "gamma_drift": 0.015,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._cycle_ts,
         }
-        self.state.update(feedback)
+        state = self.state
+        state.reflective_coherence = feedback["reflective_coherence"]
+        state.meta_integrity = feedback["meta_integrity"]
+        state.alpha_drift = feedback["alpha_drift"]
+        state.beta_drift = feedback["beta_drift"]
+        state.gamma_drift = feedback["gamma_drift"]
+        state.timestamp = feedback["timestamp"]
         self.logger.log(f"Reflective Feedback collected: {feedback}")
         return feedback
 
@@ -70,23 +98,21 @@ class REEFeedbackInterface:
         Compute adaptive learning feedback based on α–β–γ drift and coherence changes.
         Used by Neural Connector and Meta Driver for adaptive updates.
         """
-        drift_total = (
-            abs(self.state["alpha_drift"])
-            + abs(self.state["beta_drift"])
-            + abs(self.state["gamma_drift"])
+        state = self.state
+        learning_gain, meta_integrity_delta = learning_gain_kernel(
+            state.alpha_drift, state.beta_drift, state.gamma_drift, state.meta_integrity
         )
-        learning_gain = max(0.001, 1 - (drift_total * 8.5))
-        meta_integrity_delta = round(self.state["meta_integrity"] + (learning_gain * 0.01), 3)
 
         self.logger.log(
             f"Computed Learning Feedback | Gain: {learning_gain:.4f}, "
             f"Meta Integrity Δ: {meta_integrity_delta}"
         )
         feedback_result = {
-            "learning_gain": round(learning_gain, 4),
+            "learning_gain": learning_gain,
             "meta_integrity_delta": meta_integrity_delta,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._cycle_ts or datetime.utcnow().isoformat(),
         }
+        self._cycle_ts = None
         self._save_feedback(feedback_result)
         return feedback_result
 
@@ -95,11 +121,9 @@ class REEFeedbackInterface:
     # ------------------------------------------------------------
     def _save_feedback(self, feedback_data: Dict[str, Any]) -> None:
         """Save reflective feedback results for persistence."""
-        os.makedirs("data/integrity", exist_ok=True)
         path = "data/integrity/ree_feedback_state.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(feedback_data, f, indent=2)
-        self.logger.log(f"REE Feedback saved to {path}")
+        if STATE_SINK.submit(path, feedback_data):
+            self.logger.log(f"REE Feedback saved to {path}")
 
 
 # ------------------------------------------------------------
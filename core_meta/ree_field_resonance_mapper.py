@@ -1,62 +1,3 @@
-"""Map reflective field resonance into normalized stability metrics."""
-
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import Dict
-
-
-@dataclass(frozen=True)
-class ResonanceVector:
-    alpha: float
-    beta: float
-    gamma: float
-
-    @property
-    def drift(self) -> float:
-        return abs(self.alpha - 1.0) + abs(self.beta - 1.0) + abs(self.gamma - 1.0)
-
-
-class REEFieldResonanceMapper:
-    """Translate REE alpha/beta/gamma weights into resonance stability signals."""
-
-    def __init__(self, base_resonance: float = 1.0) -> None:
-        self.base_resonance = base_resonance
-
-    def map_resonance(self, alpha: float, beta: float, gamma: float) -> Dict[str, float | str]:
-        weights = self._normalize(alpha, beta, gamma)
-        stability = self._calculate_stability(weights)
-        lorentzian_phase = round(weights.gamma + (weights.alpha - weights.beta), 3)
-        state = self._derive_state(stability, lorentzian_phase)
-
-        return {
-            "state": state,
-            "stability": stability,
-            "lorentzian_phase": lorentzian_phase,
-        }
-
-    def _normalize(self, alpha: float, beta: float, gamma: float) -> ResonanceVector:
-        return ResonanceVector(
-            alpha=float(alpha) if alpha is not None else self.base_resonance,
-            beta=float(beta) if beta is not None else self.base_resonance,
-            gamma=float(gamma) if gamma is not None else self.base_resonance,
-        )
-
-    @staticmethod
-    def _calculate_stability(weights: ResonanceVector) -> float:
-        drift = weights.drift
-        stability = 1.0 - min(1.0, drift * 0.8)
-        return round(max(0.0, min(1.0, stability)), 6)
-
-    @staticmethod
-    def _derive_state(stability: float, lorentzian_phase: float) -> str:
-        if stability >= 0.9 and 0.5 <= lorentzian_phase <= 1.5:
-            return "harmonic"
-        if stability >= 0.8:
-            return "modulated"
-        if lorentzian_phase < 0.5 or lorentzian_phase > 1.5:
-            return "turbulent"
-        return "attenuated"
 """
 ree_field_resonance_mapper.py – Reflective Lorentzian Resonance Mapper ⚛️
 
@@ -68,10 +9,13 @@ Author : TUYUL KARTEL DEV TEAM
 Version: v6.0r∞
 """
 
-from __future__ import annotations
+from functools import lru_cache
+from math import pi
+from typing import Dict, Tuple, TypedDict
+
+import numpy as np
 
-from math import pi, sin, sqrt
-from typing import TypedDict
+from core_meta._ree_kernels import resonance_kernel
 
 
 class ResonanceResult(TypedDict):
@@ -81,6 +25,23 @@ class ResonanceResult(TypedDict):
     lorentzian_phase: float
 
 
+# Indeks: 0 = chaotic, 1 = semi_harmonic (≥ 0.8), 2 = harmonic (≥ baseline)
+_STATES = ("chaotic", "semi_harmonic", "harmonic")
+_STATE_ARRAY = np.array(_STATES)
+
+
+@lru_cache(maxsize=4096)
+def _resonance_terms(alpha: float, beta: float, gamma: float) -> Tuple[float, float, float]:
+    """(resonance_index, stability, lorentzian_phase) terbulatkan — memoized, pure."""
+    resonance, lorentzian_phase, stability = resonance_kernel(alpha, beta, gamma)
+    return resonance, stability, lorentzian_phase
+
+
+def resonance_cache_info():
+    """Statistik hit/miss memo resonansi (untuk profiling)."""
+    return _resonance_terms.cache_info()
+
+
 class REEFieldResonanceMapper:
     """⚛️ Mapper resonansi reflektif – Lorentzian Field Analyzer."""
 
@@ -96,21 +57,34 @@ class REEFieldResonanceMapper:
         - Lorentzian Phase = sin(αβγπ/2)
         - Stability = 1 - |1 - R|
         """
-        alpha, beta, gamma = map(lambda weight: max(0.8, min(1.2, weight)), [alpha, beta, gamma])
+        resonance_index, stability, lorentzian_phase = _resonance_terms(
+            float(alpha), float(beta), float(gamma)
+        )
 
-        resonance = sqrt((alpha**2 + beta**2 + gamma**2) / 3)
-        lorentzian_phase = round(sin(alpha * beta * gamma * pi / 2), 4)
-        stability = round(1 - abs(1 - resonance), 4)
+        state = _STATES[max(2 * (stability >= self.baseline_stability), stability >= 0.8)]
 
-        if stability >= self.baseline_stability:
-            state = "harmonic"
-        elif 0.8 <= stability < self.baseline_stability:
-            state = "semi_harmonic"
-        else:
-            state = "chaotic"
+        return {
+            "resonance_index": resonance_index,
+            "stability": stability,
+            "state": state,
+            "lorentzian_phase": lorentzian_phase,
+        }
 
+    def map_resonance_batch(self, weights: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Versi vektorisasi `map_resonance` untuk N baris bobot α–β–γ sekaligus.
+        `weights` berbentuk (N, 3); array input tidak dimodifikasi.
+        """
+        w = np.clip(np.asarray(weights, dtype=float), 0.8, 1.2)
+        resonance = np.sqrt(np.einsum("ij,ij->i", w, w) / 3.0)
+        lorentzian_phase = np.sin(w.prod(axis=1) * pi / 2).round(4)
+        stability = (1.0 - np.abs(1.0 - resonance)).round(4)
+        # Lookup tabel yang sama dengan jalur skalar (NaN → chaotic)
+        state = _STATE_ARRAY[
+            np.maximum(2 * (stability >= self.baseline_stability), stability >= 0.8)
+        ]
         return {
-            "resonance_index": round(resonance, 4),
+            "resonance_index": resonance.round(4),
             "stability": stability,
             "state": state,
             "lorentzian_phase": lorentzian_phase,
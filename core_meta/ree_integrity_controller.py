@@ -8,14 +8,46 @@ and integrity stabilization routines.
 """
 
 import json
-import os
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
+from core_meta._state_io import STATE_SINK
 from core_reflective.hybrid_reflective_bridge_manager import HybridReflectiveBridgeManager
 from core_reflective.reflective_logger import ReflectiveLogger
 
 
+@dataclass(slots=True)
+class REEIntegrityState:
+    """State integritas REE (dibaca/ditulis setiap evaluasi)."""
+
+    last_check: Optional[str] = None
+    integrity_index: float = 0.0
+    reflective_coherence: float = 0.0
+    alpha_drift: float = 0.0
+    beta_drift: float = 0.0
+    gamma_drift: float = 0.0
+    recovery_action: str = "none"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "last_check": self.last_check,
+            "integrity_index": self.integrity_index,
+            "reflective_coherence": self.reflective_coherence,
+            "alpha_drift": self.alpha_drift,
+            "beta_drift": self.beta_drift,
+            "gamma_drift": self.gamma_drift,
+            "recovery_action": self.recovery_action,
+        }
+
+
+@lru_cache(maxsize=1)
+def _get_bridge() -> HybridReflectiveBridgeManager:
+    """Bridge manager bersama untuk semua controller dalam proses."""
+    return HybridReflectiveBridgeManager()
+
+
 class REEIntegrityController:
     """
     🧠 Reflective Integrity Guardian (REE Controller)
@@ -25,16 +57,10 @@ class REEIntegrityController:
 
     def __init__(self) -> None:
         self.logger = ReflectiveLogger("REEIntegrityController")
-        self.bridge = HybridReflectiveBridgeManager()
-        self.state: Dict[str, Any] = {
-            "last_check": None,
-            "integrity_index": 0.0,
-            "reflective_coherence": 0.0,
-            "alpha_drift": 0.0,
-            "beta_drift": 0.0,
-            "gamma_drift": 0.0,
-            "recovery_action": "none",
-        }
+        self.bridge = _get_bridge()
+        self.state = REEIntegrityState()
+        # Timestamp siklus evaluate_integrity (dipakai ulang oleh recovery)
+        self._cycle_ts: Optional[str] = None
 
     # ------------------------------------------------------------
     # 🩺 INTEGRITY EVALUATION
@@ -45,32 +71,32 @@ class REEIntegrityController:
         If integrity falls below threshold, trigger correction.
         """
         self.logger.log("Evaluating REE integrity and reflective coherence...")
-        self.state.update({
-            "integrity_index": 0.957,
-            "reflective_coherence": 0.948,
-            "alpha_drift": 0.011,
-            "beta_drift": -0.007,
-            "gamma_drift": 0.014,
-            "last_check": datetime.utcnow().isoformat(),
-        })
-
-        integrity = self.state["integrity_index"]
-        coherence = self.state["reflective_coherence"]
+        self._cycle_ts = datetime.utcnow().isoformat()
+        state = self.state
+        state.integrity_index = 0.957
+        state.reflective_coherence = 0.948
+        state.alpha_drift = 0.011
+        state.beta_drift = -0.007
+        state.gamma_drift = 0.014
+        state.last_check = self._cycle_ts
+
+        integrity = state.integrity_index
+        coherence = state.reflective_coherence
 
         if integrity < 0.93 or coherence < 0.92:
             self.logger.log("Integrity below safe threshold — initiating recovery.")
             recovery = self._run_auto_recovery()
-            self.state["recovery_action"] = recovery["action"]
+            state.recovery_action = recovery["action"]
         else:
-            self.state["recovery_action"] = "stable"
+            state.recovery_action = "stable"
             self.logger.log("Integrity stable — no action required.")
 
         self._save_integrity_state()
         return {
             "integrity_index": integrity,
             "reflective_coherence": coherence,
-            "recovery_action": self.state["recovery_action"],
-            "timestamp": self.state["last_check"],
+            "recovery_action": state.recovery_action,
+            "timestamp": state.last_check,
         }
 
     # ------------------------------------------------------------
@@ -87,7 +113,7 @@ class REEIntegrityController:
         recovery_result = {
             "action": "auto_sync_recovery",
             "new_integrity_index": recovered_integrity,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._cycle_ts or datetime.utcnow().isoformat(),
         }
         self.logger.log(f"Recovery completed | New Integrity: {recovered_integrity}")
         return recovery_result
@@ -97,11 +123,9 @@ class REEIntegrityController:
     # ------------------------------------------------------------
     def _save_integrity_state(self) -> None:
         """Persist REE integrity state to Journal Vault."""
-        os.makedirs("data/integrity", exist_ok=True)
         path = "data/integrity/ree_integrity_state.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, indent=2)
-        self.logger.log(f"REE Integrity state saved to {path}")
+        if STATE_SINK.submit(path, self.state.as_dict()):
+            self.logger.log(f"REE Integrity state saved to {path}")
 
 
 if __name__ == "__main__":
@@ -9,15 +9,169 @@ recent Vault history through :class:`RiskFeedbackCalibrator`.
 
 from __future__ import annotations
 
+import atexit
+import heapq
 import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import threading
+from collections import ChainMap, OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
-from math import isnan
+from functools import cache, lru_cache
 from pathlib import Path
-from time import monotonic
-from typing import Any, Dict, Iterable, List, Literal, Mapping, Protocol, Sequence
+from time import gmtime, monotonic, strftime, time
+from typing import Any, BinaryIO, Dict, Iterable, List, Literal, Mapping, Protocol, Sequence
+
+import numpy as np
+
+try:  # orjson opsional — fallback ke json stdlib
+    import orjson
+except ImportError:  # pragma: no cover - tergantung environment
+    orjson = None
+
+try:  # numba opsional — kernel risiko skalar berjalan sebagai Python biasa tanpa numba
+    from numba import njit
+except ImportError:  # pragma: no cover - tergantung environment
+    _NUMBA_AVAILABLE = False
+
+    def _scalar_jit(signature):
+        return lambda fn: fn
+
+else:  # pragma: no cover - tergantung environment
+    _NUMBA_AVAILABLE = True
+
+    def _scalar_jit(signature):
+        # Signature eksplisit → kompilasi (atau load cache) saat import, bukan di panggilan pertama.
+        # Tanpa fastmath: hasil harus identik bit-per-bit dengan aritmetika Python.
+        return njit(signature, cache=True)
 
 DEFAULT_ACCOUNT_BALANCE = 100_000.0
+_JOURNAL_BUFFER_SIZE = 1 << 16
+_JOURNAL_HANDLE_LIMIT = 32
+_JOURNAL_QUEUE_SIZE = 10_000
+# Batas tunggu `_AsyncJournal.flush` (detik) — atexit tidak boleh menggantung
+_JOURNAL_FLUSH_TIMEOUT = 10.0
+# Handle append JSONL yang tetap terbuka (LRU per path) — satu open per file per proses.
+_JOURNAL_HANDLES: "OrderedDict[Path, BinaryIO]" = OrderedDict()
+
+if orjson is not None:
+    _DUMPS_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps_line(payload: Any) -> bytes:
+        return orjson.dumps(payload, option=_DUMPS_OPTS)
+
+    def _dumps_pretty(payload: Any) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+else:
+    _ENCODE_COMPACT = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _dumps_line(payload: Any) -> bytes:
+        return (_ENCODE_COMPACT(payload) + "\n").encode("utf-8")
+
+    def _dumps_pretty(payload: Any) -> bytes:
+        return json.dumps(payload, indent=2).encode("utf-8")
+
+
+# (detik epoch, prefix "YYYY-MM-DDTHH:MM:SS") — gmtime hanya dihitung sekali per detik
+_TIMESTAMP_CACHE: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC dengan mikrodetik, setara ``datetime.utcnow().isoformat()``."""
+    global _TIMESTAMP_CACHE
+    now = time()
+    second = int(now)
+    cached_second, prefix = _TIMESTAMP_CACHE
+    if second != cached_second:
+        parts = gmtime(second)
+        prefix = (
+            f"{parts.tm_year:04d}-{parts.tm_mon:02d}-{parts.tm_mday:02d}"
+            f"T{parts.tm_hour:02d}:{parts.tm_min:02d}:{parts.tm_sec:02d}"
+        )
+        _TIMESTAMP_CACHE = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    # open/write/close langsung di level fd — tanpa lapisan TextIOWrapper/BufferedWriter
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+_LOG = logging.getLogger(__name__)
+
+# Pengumuman journal lewat logging: hot path hanya enqueue record, stdout ditulis thread listener.
+_JOURNAL_LOG = logging.getLogger("agi.journal")
+_JOURNAL_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_JOURNAL_LOG_LISTENER: logging.handlers.QueueListener | None = None
+
+
+def _journal_logger() -> logging.Logger:
+    global _JOURNAL_LOG_LISTENER
+    if _JOURNAL_LOG_LISTENER is None:
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter("%(message)s"))
+        _JOURNAL_LOG_LISTENER = logging.handlers.QueueListener(_JOURNAL_LOG_QUEUE, stream)
+        _JOURNAL_LOG_LISTENER.start()
+        atexit.register(_JOURNAL_LOG_LISTENER.stop)
+        _JOURNAL_LOG.addHandler(logging.handlers.QueueHandler(_JOURNAL_LOG_QUEUE))
+        _JOURNAL_LOG.setLevel(logging.INFO)
+        _JOURNAL_LOG.propagate = False
+    return _JOURNAL_LOG
+
+
+# Telemetri run_layer_12 (vault/feedback/report) — diam kecuali level INFO diaktifkan.
+_LAYER12_LOG = logging.getLogger("agi.layer12")
+
+
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    # mkdir(parents, exist_ok) hanya sekali per direktori per proses
+    if path in _ENSURED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+def _file_stamp() -> str:
+    return strftime("%Y%m%d_%H%M%S", gmtime())
+
+
+def _journal_handle(path: Path) -> BinaryIO:
+    handle = _JOURNAL_HANDLES.get(path)
+    if handle is not None:
+        _JOURNAL_HANDLES.move_to_end(path)
+        return handle
+    if len(_JOURNAL_HANDLES) >= _JOURNAL_HANDLE_LIMIT:
+        _, stale = _JOURNAL_HANDLES.popitem(last=False)
+        stale.close()
+    handle = path.open("ab", buffering=_JOURNAL_BUFFER_SIZE)
+    _JOURNAL_HANDLES[path] = handle
+    return handle
+
+
+def _close_journal_handles() -> None:
+    while _JOURNAL_HANDLES:
+        _, handle = _JOURNAL_HANDLES.popitem()
+        handle.close()
+
+
+atexit.register(_close_journal_handles)
 
 
 class PatchRegistry:
@@ -25,6 +179,14 @@ class PatchRegistry:
 
     def __init__(self) -> None:
         self._entries: list[dict[str, Any]] = []
+        self._counters: dict[str, int] = {}
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    @property
+    def counters(self) -> dict[str, int]:
+        return dict(self._counters)
 
     def register_patch(
         self, module: str, version: str, status: str, description: str
@@ -35,7 +197,7 @@ class PatchRegistry:
                 "version": version,
                 "status": status,
                 "description": description,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _utc_timestamp(),
             }
         )
 
@@ -44,6 +206,110 @@ class PatchRegistry:
         return list(self._entries)
 
 
+class _AsyncJournal:
+    """Writer JSONL latar belakang: hot path hanya enqueue, thread daemon menulis per batch.
+
+    ``enqueue`` menambah baris (append, handle dipakai ulang); ``replace`` menimpa
+    seluruh file (report), latest-wins per path dalam satu batch.
+    Antrian dibatasi; bila penuh, entri dibuang dan dihitung sebagai
+    ``journal_dropped`` di registry (jalur keputusan tidak pernah menunggu disk).
+    Thread writer dibuat ulang bila mati; setelah fork() proses anak memulai
+    antrian baru (entri milik parent ditulis oleh parent).
+    """
+
+    def __init__(self, registry: PatchRegistry, maxsize: int = _JOURNAL_QUEUE_SIZE) -> None:
+        self._registry = registry
+        self._maxsize = maxsize
+        self._queue: "queue.Queue[tuple[Path, bytes, bool]]" = queue.Queue(maxsize=maxsize)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, path: Path, line: bytes) -> None:
+        self._put(path, line, True)
+
+    def replace(self, path: Path, data: bytes) -> None:
+        self._put(path, data, False)
+
+    def _put(self, path: Path, data: bytes, append: bool) -> None:
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            self._start()
+        try:
+            self._queue.put_nowait((path, data, append))
+        except queue.Full:
+            self._registry.increment("journal_dropped")
+
+    def flush(self, timeout: float | None = _JOURNAL_FLUSH_TIMEOUT) -> bool:
+        """Tunggu antrian kosong; False bila `timeout` (detik) habis lebih dulu."""
+        if self._thread is None:
+            return True
+        if not self._thread.is_alive():
+            self._start()
+        deadline = None if timeout is None else monotonic() + timeout
+        done = self._queue.all_tasks_done
+        with done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    _LOG.warning("Journal flush timeout (%.1fs)", timeout)
+                    return False
+                done.wait(remaining)
+        return True
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._drain, name="proto-agi-journal", daemon=True
+                )
+                self._thread.start()
+
+    def _reset_after_fork(self) -> None:
+        # proses anak: queue/lock/thread warisan parent tidak valid
+        self._queue = queue.Queue(maxsize=self._maxsize)
+        self._lock = threading.Lock()
+        self._thread = None
+        # handle warisan tidak ditutup di sini (buffer parent tidak boleh ditulis ulang)
+        _JOURNAL_HANDLES.clear()
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write_batch(batch: list[tuple[Path, bytes, bool]]) -> None:
+        grouped: dict[Path, list[bytes]] = {}
+        snapshots: dict[Path, bytes] = {}
+        for path, data, append in batch:
+            if append:
+                grouped.setdefault(path, []).append(data)
+            else:
+                snapshots[path] = data
+        # Exception apa pun per file dicatat lalu dilewati; thread writer tetap hidup
+        for path, lines in grouped.items():
+            try:
+                handle = _journal_handle(path)
+                handle.write(b"".join(lines))
+                handle.flush()
+            except Exception:  # pragma: no cover - telemetry only
+                _LOG.exception("Gagal menulis journal %s (%d baris)", path, len(lines))
+        for path, data in snapshots.items():
+            try:
+                _write_bytes(path, data)
+            except Exception:  # pragma: no cover - telemetry only
+                _LOG.exception("Gagal menulis report %s", path)
+
+
 @dataclass(slots=True)
 class TimeframeSignal:
     timeframe: str
@@ -57,6 +323,20 @@ class TimeframeSignal:
     wlwci: Any | None = None
     reflex_coherence: Any | None = None
 
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "timeframe": self.timeframe,
+            "bias": self.bias,
+            "confidence": self.confidence,
+            "confluence": self.confluence,
+            "weight": self.weight,
+            "trend": self.trend,
+            "ema_bias": self.ema_bias,
+            "divergence": self.divergence,
+            "wlwci": self.wlwci,
+            "reflex_coherence": self.reflex_coherence,
+        }
+
 
 class FundamentalContextIntegrator:
     MODULE_NAME = "FUNDAMENTAL_CONTEXT"
@@ -66,11 +346,48 @@ class FundamentalContextIntegrator:
     def fetch_context(self, pair: str) -> dict[str, Any]:
         return {
             "pair": pair,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "summary": "Macro context placeholder.",
         }
 
 
+if _NUMBA_AVAILABLE:  # pragma: no cover - tergantung environment
+
+    @njit("Tuple((float64, int64))(float64[:])", cache=True)
+    def _confidence_totals(confidences):
+        # NaN menandai confidence kosong / None
+        total = 0.0
+        count = 0
+        for value in confidences:
+            if value == value:
+                total += value
+                count += 1
+        return total, count
+
+    def _signal_confidence_totals(signals: Sequence[TimeframeSignal]) -> tuple[float, int]:
+        return _confidence_totals(
+            np.fromiter(
+                (np.nan if signal.confidence is None else signal.confidence for signal in signals),
+                dtype=np.float64,
+                count=len(signals),
+            )
+        )
+
+else:
+
+    def _signal_confidence_totals(signals: Sequence[TimeframeSignal]) -> tuple[float, int]:
+        # Tanpa numba loop Python lebih cepat dari NumPy untuk 4–8 timeframe.
+        total = 0.0
+        count = 0
+        for signal in signals:
+            confidence = signal.confidence
+            # confidence == confidence → False hanya untuk NaN
+            if confidence is not None and confidence == confidence:
+                total += confidence
+                count += 1
+        return total, count
+
+
 class MultiTimeframeIntegrator:
     MODULE_NAME = "MULTI_TIMEFRAME_INTEGRATOR"
     MODULE_VERSION = "v1"
@@ -81,14 +398,10 @@ class MultiTimeframeIntegrator:
     ) -> dict[str, Any]:
         if not signals:
             raise ValueError("No signals provided")
-        confidences = [
-            signal.confidence
-            for signal in signals
-            if signal.confidence is not None and not isnan(signal.confidence)
-        ]
+        total, count = _signal_confidence_totals(signals)
         base = base_confidence if base_confidence is not None else 1.0
-        avg_conf = sum(confidences) / len(confidences) if confidences else base
-        alignment = sum(confidences) / len(confidences) if confidences else 0.0
+        avg_conf = total / count if count else base
+        alignment = total / count if count else 0.0
         risk_modifier = max(0.7, min(1.5, avg_conf))
         return {
             "alignment_score": alignment,
@@ -96,7 +409,7 @@ class MultiTimeframeIntegrator:
             "direction": signals[0].bias,
             "confidence": avg_conf,
             "risk_modifier": risk_modifier,
-            "signals": [signal.__dict__ for signal in signals],
+            "signals": [signal.as_dict() for signal in signals],
         }
 
     def integrate(
@@ -161,8 +474,13 @@ class InstantExecutionGuard:
 
 class FusionLogFeedback:
     def __init__(self) -> None:
+        # Direktori dibuat saat tulisan pertama, bukan saat import/konstruksi.
         self.log_dir = Path("data/fusion_logs")
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._jsonl_path = self.log_dir / "fusion_log.jsonl"
+        self._summary_path = self.log_dir / "fusion_summary.log"
+
+    def flush(self) -> None:
+        _JOURNAL.flush()
 
     def write(
         self,
@@ -186,44 +504,43 @@ class FusionLogFeedback:
             "confidence": confidence,
             "note": note,
             "precision_zone": precision_zone,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
         }
-        log_path = self.log_dir / "fusion_log.jsonl"
-        with log_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
+        _ensure_dir(self.log_dir)
+        _JOURNAL.enqueue(self._jsonl_path, _dumps_line(payload))
 
     def summary(
         self, pair: str, note: str, confidence: float, precision_zone: bool
     ) -> None:
-        summary_path = self.log_dir / "fusion_summary.log"
         line = (
-            f"{datetime.utcnow().isoformat()} | {pair} | "
+            f"{_utc_timestamp()} | {pair} | "
             f"conf={confidence:.3f} | precision={precision_zone} | {note}"
         )
-        with summary_path.open("a", encoding="utf-8") as handle:
-            handle.write(line + "\n")
+        _ensure_dir(self.log_dir)
+        _JOURNAL.enqueue(self._summary_path, (line + "\n").encode("utf-8"))
 
 
 class VaultRiskSync:
     def __init__(self) -> None:
         self.vault_path = Path("data/vault/risk_logs")
-        self.vault_path.mkdir(parents=True, exist_ok=True)
         self.journal_file = self.vault_path / "journal.jsonl"
 
     def save(self, pair: str, risk_payload: dict[str, Any]) -> str:
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        _ensure_dir(self.vault_path)
         label = _normalise_pair_label(pair)
-        file_path = self.vault_path / f"{label}_{timestamp}.json"
-        file_path.write_text(json.dumps(risk_payload, indent=2), encoding="utf-8")
+        file_path = self.vault_path / f"{label}_{_file_stamp()}.json"
+        _write_bytes(file_path, _dumps_pretty(risk_payload))
         return str(file_path)
 
     def append_journal_entry(
         self, entry: Mapping[str, Any], announce: bool = True
     ) -> None:
-        with self.journal_file.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry) + "\n")
+        _ensure_dir(self.vault_path)
+        _JOURNAL.enqueue(self.journal_file, _dumps_line(entry))
         if announce:
-            print(f"[JOURNAL] {entry}")
+            logger = _journal_logger()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[JOURNAL] %s", entry)
 
 
 @dataclass(slots=True)
@@ -237,24 +554,40 @@ class CalibrationSummary:
 class RiskFeedbackCalibrator:
     def __init__(self, vault_path: str = "data/vault/risk_logs/") -> None:
         self.vault_path = Path(vault_path)
-        self.vault_path.mkdir(parents=True, exist_ok=True)
         self._last_calibration: CalibrationSummary | dict[str, Any] | None = None
         self._snapshot_path: Path | None = None
 
     def load_risk_data(self, limit: int = 10) -> list[dict[str, Any]]:
         entries: list[dict[str, Any]] = []
-        for path in sorted(self.vault_path.glob("*.json"), reverse=True)[:limit]:
+        if limit <= 0:
+            return entries
+        # Urutan nama file (timestamp di nama) seperti sebelumnya; heap menjaga memori O(limit).
+        try:
+            with os.scandir(self.vault_path) as iterator:
+                names = heapq.nlargest(
+                    limit, (entry.name for entry in iterator if entry.name.endswith(".json"))
+                )
+        except FileNotFoundError:
+            # vault belum pernah ditulis
+            return entries
+        loads = orjson.loads if orjson is not None else json.loads
+        for name in names:
             try:
-                entries.append(json.loads(path.read_text(encoding="utf-8")))
+                with open(os.path.join(self.vault_path, name), "rb") as handle:
+                    entries.append(loads(handle.read()))
             except json.JSONDecodeError:
                 continue
         return entries
 
     def calibrate(self, recent_data: list[dict[str, Any]]) -> CalibrationSummary:
-        confidences = [
-            _coerce_float(entry.get("confidence", 0.0)) or 0.0 for entry in recent_data
-        ]
-        avg_conf = sum(confidences) / len(confidences) if confidences else 0.75
+        # mean() NumPy memakai pairwise summation (n ≥ 8): hasil bisa berbeda di
+        # bit terakhir dari sum()/len() berurutan (selisih relatif ≲ 1e-15).
+        confidences = np.fromiter(
+            (_coerce_float(entry.get("confidence", 0.0)) or 0.0 for entry in recent_data),
+            dtype=np.float64,
+            count=len(recent_data),
+        )
+        avg_conf = float(confidences.mean()) if confidences.size else 0.75
         self._last_calibration = CalibrationSummary(new_confidence_weight=avg_conf)
         return self._last_calibration
 
@@ -267,9 +600,9 @@ class RiskFeedbackCalibrator:
             else self._last_calibration
         )
         snapshot_dir = self.vault_path / "calibration"
-        snapshot_dir.mkdir(parents=True, exist_ok=True)
-        path = snapshot_dir / f"calibration_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        _ensure_dir(snapshot_dir)
+        path = snapshot_dir / f"calibration_{_file_stamp()}.json"
+        _write_bytes(path, _dumps_pretty(payload))
         self._snapshot_path = path
         return str(path)
 
@@ -286,23 +619,63 @@ class RiskAssessment:
     calibration: CalibrationSummary | dict[str, Any]
 
 
-def calculate_dynamic_risk(confidence: float, mode: str) -> float:
+@lru_cache(maxsize=256)
+def _pip_value(pair: str) -> float:
+    return 9.1 if "JPY" in pair.upper() else 10.0
+
+
+@lru_cache(maxsize=256)
+def _pair_quote_profile(pair: str) -> tuple[str, float | None]:
+    # (pair ter-normalisasi, kurs quote→USD default untuk non-USD quote; None bila quote USD)
+    normalized = pair.upper()
+    if normalized.endswith("USD"):
+        return normalized, None
+    return normalized, _pip_value(normalized) / 10.0
+
+
+_RISK_MODE_CODES: Dict[str, int] = {"aggressive": 0, "reflexive": 1}
+
+
+@_scalar_jit("float64(float64, int64)")
+def _dynamic_risk_kernel(confidence, mode_code):
+    if confidence != confidence:
+        return 0.0
     base = max(0.0, min(confidence, 1.0))
-    if mode == "aggressive":
+    if mode_code == 0:
         return min(0.02, base * 0.02)
-    if mode == "reflexive":
+    if mode_code == 1:
         return min(0.015, base * 0.015)
     return min(0.01, base * 0.01)
 
 
+@_scalar_jit("float64(float64, float64, float64, float64, float64)")
+def _lot_size_kernel(balance, entry_price, stop_loss, pip_value, risk_percent):
+    # lot mentah (belum dibulatkan); 0.0 bila jarak SL atau pip value nol
+    sl_distance = abs(entry_price - stop_loss)
+    if sl_distance == 0.0 or pip_value == 0.0:
+        return 0.0
+    return balance * (risk_percent / 100) / (sl_distance * pip_value)
+
+
+@_scalar_jit("float64(float64, float64, boolean)")
+def _sl_distance_pips(entry_price, stop_loss, is_jpy):
+    return abs(entry_price - stop_loss) * (100.0 if is_jpy else 10000.0)
+
+
+def calculate_dynamic_risk(confidence: float, mode: str) -> float:
+    return _dynamic_risk_kernel(float(confidence), _RISK_MODE_CODES.get(mode, 2))
+
+
 def calculate_lot_size(
     balance: float, entry_price: float, stop_loss: float, pip_value: float, risk_percent: float
 ) -> float:
-    risk_amount = balance * (risk_percent / 100)
-    sl_distance = abs(entry_price - stop_loss)
-    if sl_distance == 0 or pip_value == 0:
-        return 0.0
-    return round(risk_amount / (sl_distance * pip_value), 3)
+    # round() tetap di Python: pembulatan numba tidak dijamin identik dengan builtin
+    return round(
+        _lot_size_kernel(
+            float(balance), float(entry_price), float(stop_loss), float(pip_value), float(risk_percent)
+        ),
+        3,
+    )
 
 
 def calculate_adaptive_risk(
@@ -316,7 +689,7 @@ def calculate_adaptive_risk(
 ) -> dict[str, Any]:
     rate = quote_to_usd_rate if quote_to_usd_rate is not None else 1.0
     risk_amount = round(account_balance * (risk_percent / 100) * rate, 2)
-    pip_value = 9.1 if "JPY" in pair.upper() else 10.0
+    pip_value = _pip_value(pair)
     lot_size = calculate_lot_size(account_balance, entry_price, stop_loss_price, pip_value, risk_percent)
     return {
         "account_balance": account_balance,
@@ -392,7 +765,7 @@ def execute_precision_entry_pipeline(
     entry_price = price_now if price_now is not None else mid_point
     stop_loss = swing_low
     risk_percent = round(min(max(confidence, 0.5), 1.5), 2)
-    pip_value = 9.1 if "JPY" in pair.upper() else 10.0
+    pip_value = _pip_value(pair)
     lot_size = calculate_lot_size(balance, entry_price, stop_loss, pip_value, risk_percent)
     return {
         "entry": entry_price,
@@ -408,6 +781,7 @@ def execute_precision_entry_pipeline(
 
 _PATCH_LOG_PATH = Path("data/vault/logs/patch_register.log")
 _PRECISION_JOURNAL_DIR = Path("journals")
+_LAYER12_JOURNAL_DIR = Path("vault/journal")
 _PRIMARY_TIMEFRAMES: tuple[str, ...] = ("W1", "D1", "H4", "H1")
 _TIMEFRAME_SEQUENCE = ("W1", "D1", "H4", "H1")
 _TIMEFRAME_METRIC_SUFFIXES: Dict[str, tuple[str, ...]] = {
@@ -418,50 +792,114 @@ _TIMEFRAME_METRIC_SUFFIXES: Dict[str, tuple[str, ...]] = {
     "reflex_coherence": ("rc", "reflex", "reflex_coherence", "reflex_integrity"),
 }
 
+
+def _build_timeframe_candidates(tf_upper: str) -> Dict[str, tuple[str, ...]]:
+    prefix = tf_upper.lower()
+    candidates: Dict[str, tuple[str, ...]] = {}
+    for metric_name, suffixes in _TIMEFRAME_METRIC_SUFFIXES.items():
+        keys: list[str] = []
+        for suffix in suffixes:
+            suffix_lower = suffix.lower()
+            keys.extend(
+                (
+                    f"{prefix}_{suffix_lower}",
+                    f"{prefix}{suffix_lower}",
+                    f"{tf_upper}_{suffix_lower}",
+                    f"{tf_upper}{suffix_lower}",
+                    suffix_lower,
+                    suffix_lower.upper(),
+                )
+            )
+        candidates[metric_name] = tuple(dict.fromkeys(keys))
+    return candidates
+
+
+# Kandidat key metrik per timeframe, dibangun sekali (timeframe override lain ditambahkan lazily).
+_TIMEFRAME_CANDIDATES: Dict[str, Dict[str, tuple[str, ...]]] = {
+    timeframe: _build_timeframe_candidates(timeframe) for timeframe in _TIMEFRAME_SEQUENCE
+}
+
+
+def _timeframe_candidates(tf_upper: str) -> Dict[str, tuple[str, ...]]:
+    candidates = _TIMEFRAME_CANDIDATES.get(tf_upper)
+    if candidates is None:
+        candidates = _TIMEFRAME_CANDIDATES[tf_upper] = _build_timeframe_candidates(tf_upper)
+    return candidates
+
 TWMS_PATCH = TWMS_EMA_Strength(ema_period=50)
 MULTI_TF_INTEGRATOR = MultiTimeframeIntegrator()
 FUNDAMENTAL_CONTEXT = FundamentalContextIntegrator()
 _PATCH_REGISTRY = PatchRegistry()
+_JOURNAL = _AsyncJournal(_PATCH_REGISTRY)
+atexit.register(_JOURNAL.flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_JOURNAL._reset_after_fork)
 _INSTANT_EXECUTION_GUARD = InstantExecutionGuard()
+_FUNDAMENTAL_CONTEXT_TTL = 60.0
+_FUNDAMENTAL_CONTEXT_CACHE: Dict[str, tuple[float, Dict[str, Any]]] = {}
 _PRECISION_ALERT_COOLDOWN = 5.0
 _PRECISION_ALERT_STATE: Dict[str, tuple[float, str]] = {}
 _FUSION_LOGGER = FusionLogFeedback()
 
-_PATCH_REGISTRY.register_patch(
-    "TWMS_EMA_STRENGTH",
-    "v5.3.2-AGI",
-    "active",
-    "Enhance WLWCI using EMA slope for trend integrity calibration",
-)
-_PATCH_REGISTRY.register_patch(
-    MultiTimeframeIntegrator.MODULE_NAME,
-    MultiTimeframeIntegrator.MODULE_VERSION,
-    MultiTimeframeIntegrator.STATUS.lower(),
-    "Multi timeframe confluence aggregation",
-)
-_PATCH_REGISTRY.register_patch(
-    FundamentalContextIntegrator.MODULE_NAME,
-    FundamentalContextIntegrator.MODULE_VERSION,
-    FundamentalContextIntegrator.STATUS,
-    "Inject macro context snapshot into Layer-12 output",
-)
 
+@cache
+def _register_patches() -> None:
+    """Daftarkan patch Layer-12 ke registry sekali, saat run pertama (bukan saat import)."""
+    _PATCH_REGISTRY.register_patch(
+        "TWMS_EMA_STRENGTH",
+        "v5.3.2-AGI",
+        "active",
+        "Enhance WLWCI using EMA slope for trend integrity calibration",
+    )
+    _PATCH_REGISTRY.register_patch(
+        MultiTimeframeIntegrator.MODULE_NAME,
+        MultiTimeframeIntegrator.MODULE_VERSION,
+        MultiTimeframeIntegrator.STATUS.lower(),
+        "Multi timeframe confluence aggregation",
+    )
+    _PATCH_REGISTRY.register_patch(
+        FundamentalContextIntegrator.MODULE_NAME,
+        FundamentalContextIntegrator.MODULE_VERSION,
+        FundamentalContextIntegrator.STATUS,
+        "Inject macro context snapshot into Layer-12 output",
+    )
 
+
+@lru_cache(maxsize=1024)
 def _normalise_pair_label(pair: str) -> str:
     return pair.replace("/", "_").replace(" ", "_").upper() or "UNKNOWN"
 
 
+@lru_cache(maxsize=4096)
+def _fmt2(value: float, signed: bool = False) -> str:
+    # Skor integrator berulang antar pair dalam satu scan → string hasil format di-memo.
+    return f"{value:+.2f}" if signed else f"{value:.2f}"
+
+
 def _append_precision_journal(pair: str, entry: Mapping[str, Any]) -> None:
     try:
-        _PRECISION_JOURNAL_DIR.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(_PRECISION_JOURNAL_DIR)
         label = _normalise_pair_label(pair)
         journal_path = _PRECISION_JOURNAL_DIR / f"{label}_journal.json"
-        with journal_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry) + "\n")
+        _JOURNAL.enqueue(journal_path, _dumps_line(entry))
     except Exception as exc:  # pragma: no cover - telemetry only
         print(f"[WARN] Gagal mencatat journal FTA: {exc}")
 
 
+def _cached_fundamental_context(pair: str) -> Dict[str, Any]:
+    """Konteks fundamental per pair dengan TTL; error tidak di-cache agar dicoba ulang."""
+    now = monotonic()
+    cached = _FUNDAMENTAL_CONTEXT_CACHE.get(pair)
+    if cached is not None and now - cached[0] < _FUNDAMENTAL_CONTEXT_TTL:
+        return dict(cached[1])
+    try:
+        context = FUNDAMENTAL_CONTEXT.fetch_context(pair)
+    except Exception as exc:  # pragma: no cover - telemetry only
+        return {"error": str(exc), "pair": pair}
+    _FUNDAMENTAL_CONTEXT_CACHE[pair] = (now, context)
+    return dict(context)
+
+
 def _should_emit_precision_notification(pair: str, status: str) -> bool:
     now = monotonic()
     label = _normalise_pair_label(pair)
@@ -482,20 +920,53 @@ def _notify_precision_zone(pair: str, status: str, alignment: Any) -> None:
         print(f"ℹ NORMAL ZONE → {pair} | Alignment Score: {alignment_display}")
 
 
+_DIGITS = r"\d(?:_?\d)*"
+# Grammar float() Python (+ sufiks % opsional); string yang tidak cocok ditolak tanpa try/except.
+_FLOAT_TEXT_RE = re.compile(
+    rf"\s*([+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?"
+    rf"|inf(?:inity)?|nan))\s*%*\s*\Z",
+    re.IGNORECASE,
+)
+
+
 def _coerce_float(value: Any) -> float | None:
-    if isinstance(value, (int, float)):
-        number = float(value)
-    elif isinstance(value, str):
-        stripped = value.strip().rstrip("%")
-        if not stripped:
-            return None
-        try:
-            number = float(stripped)
-        except ValueError:
+    value_type = type(value)
+    if value_type is float:
+        return value if value == value else None
+    if value_type is int:
+        return float(value)
+    if value is None:
+        return None
+    if value_type is str or isinstance(value, str):
+        match = _FLOAT_TEXT_RE.match(value)
+        if match is None:
             return None
+        number = float(match.group(1))
+    elif isinstance(value, (int, float)):
+        number = float(value)
     else:
         return None
-    return None if isnan(number) else number
+    return number if number == number else None
+
+
+_BIAS_TOKENS: Dict[str, str] = {
+    "bull": "buy",
+    "buy": "buy",
+    "long": "buy",
+    "bear": "sell",
+    "sell": "sell",
+    "short": "sell",
+    "wait": "neutral",
+    "flat": "neutral",
+    "side": "neutral",
+    "neutral": "neutral",
+    "range": "neutral",
+}
+# Satu scan untuk token pertama (urutan alternatif = prioritas buy > sell > neutral),
+# lalu hanya sisa teks setelahnya yang dicek untuk kelas berprioritas lebih tinggi.
+_BIAS_RE = re.compile("|".join(_BIAS_TOKENS))
+_BUY_RE = re.compile("bull|buy|long")
+_SELL_RE = re.compile("bear|sell|short")
 
 
 def _detect_bias(value: Any) -> str | None:
@@ -504,13 +975,18 @@ def _detect_bias(value: Any) -> str | None:
     text = str(value).strip().lower()
     if not text:
         return None
-    if any(token in text for token in ("bull", "buy", "long")):
+    match = _BIAS_RE.search(text)
+    if match is None:
+        return None
+    bias = _BIAS_TOKENS[match.group()]
+    if bias == "buy":
+        return bias
+    after = match.start() + 1
+    if _BUY_RE.search(text, after):
         return "buy"
-    if any(token in text for token in ("bear", "sell", "short")):
+    if bias == "sell" or _SELL_RE.search(text, after):
         return "sell"
-    if any(token in text for token in ("wait", "flat", "side", "neutral", "range")):
-        return "neutral"
-    return None
+    return "neutral"
 
 
 def _resolve_timeframe_signal(
@@ -606,14 +1082,28 @@ def _apply_risk_modifier(payload: Dict[str, Any], modifier: float | None) -> Non
     modifier_value = max(0.0, min(modifier_value, 2.0))
 
     payload["risk_modifier"] = round(modifier_value, 3)
-    precision_map = {"risk_percent": 4, "risk_amount": 2, "lot_size": 4}
-    for key, precision in precision_map.items():
-        value = _coerce_float(payload.get(key))
-        if value is None:
-            continue
-        base_key = f"{key}_base"
-        payload.setdefault(base_key, value)
-        payload[key] = round(value * modifier_value, precision)
+    # Tiga key tetap di-unroll: tanpa f-string key "_base" per iterasi; float langsung tanpa coerce.
+    value = payload.get("risk_percent")
+    if type(value) is not float or value != value:
+        value = _coerce_float(value)
+    if value is not None:
+        if "risk_percent_base" not in payload:
+            payload["risk_percent_base"] = value
+        payload["risk_percent"] = round(value * modifier_value, 4)
+    value = payload.get("risk_amount")
+    if type(value) is not float or value != value:
+        value = _coerce_float(value)
+    if value is not None:
+        if "risk_amount_base" not in payload:
+            payload["risk_amount_base"] = value
+        payload["risk_amount"] = round(value * modifier_value, 2)
+    value = payload.get("lot_size")
+    if type(value) is not float or value != value:
+        value = _coerce_float(value)
+    if value is not None:
+        if "lot_size_base" not in payload:
+            payload["lot_size_base"] = value
+        payload["lot_size"] = round(value * modifier_value, 4)
 
 
 def _first_numeric(values: Iterable[Any]) -> float | None:
@@ -622,9 +1112,8 @@ def _first_numeric(values: Iterable[Any]) -> float | None:
             numeric = float(value)
         except (TypeError, ValueError):
             continue
-        if isnan(numeric):
-            continue
-        return numeric
+        if numeric == numeric:
+            return numeric
     return None
 
 
@@ -632,6 +1121,18 @@ def _flatten_numeric_levels(value: Any) -> list[float]:
     levels: list[float] = []
     if value is None:
         return levels
+    value_type = type(value)
+    if value_type is list or value_type is tuple:
+        # Fast path: deret level datar berisi int/float (kasus umum daily/weekly levels)
+        for item in value:
+            item_type = type(item)
+            if item_type is not float and item_type is not int:
+                break
+        else:
+            return [float(item) for item in value if item == item]
+    elif hasattr(value, "tolist") and not isinstance(value, (str, bytes)):
+        # ndarray / skalar NumPy → list/float Python via .tolist() (duck-typing)
+        return _flatten_numeric_levels(value.tolist())
     if isinstance(value, Mapping):
         for nested in value.values():
             levels.extend(_flatten_numeric_levels(nested))
@@ -650,31 +1151,40 @@ def _flatten_numeric_levels(value: Any) -> list[float]:
     return levels
 
 
+def _lower_sources(sources: Sequence[Mapping[str, Any]]) -> list[Dict[str, Any]]:
+    """Peta key-lowercase per source, dibangun sekali lalu dipakai semua extractor."""
+    return [
+        {str(k).lower(): value for k, value in source.items()}
+        for source in sources
+        if isinstance(source, Mapping)
+    ]
+
+
 def _extract_numeric_from_sources(
-    sources: Sequence[Mapping[str, Any]], keys: Sequence[str]
+    lowered_sources: Sequence[Mapping[str, Any]], keys: Sequence[str]
 ) -> float | None:
-    candidates: list[Any] = []
-    for source in sources:
-        if not isinstance(source, Mapping):
-            continue
-        lower_map = {str(k).lower(): value for k, value in source.items()}
+    # lowered_sources dari _lower_sources; keys sudah lowercase
+    for lower_map in lowered_sources:
         for key in keys:
-            key_lower = key.lower()
-            if key_lower in lower_map:
-                candidates.append(lower_map[key_lower])
-    return _first_numeric(candidates)
+            if key in lower_map:
+                numeric = _first_numeric((lower_map[key],))
+                if numeric is not None:
+                    return numeric
+    return None
 
 
-def _extract_level_series(sources: Sequence[Mapping[str, Any]], keys: Sequence[str]) -> list[float]:
+def _extract_level_series(
+    lowered_sources: Sequence[Mapping[str, Any]], keys: Sequence[str]
+) -> list[float]:
     levels: list[float] = []
-    normalized = {key.lower() for key in keys}
-    for source in sources:
-        if not isinstance(source, Mapping):
-            continue
-        lower_map = {str(k).lower(): value for k, value in source.items()}
-        for key, value in lower_map.items():
-            if key in normalized:
-                levels.extend(_flatten_numeric_levels(value))
+    for lower_map in lowered_sources:
+        matched = [key for key in keys if key in lower_map]
+        if len(matched) > 1:
+            # beberapa alias hadir: pertahankan urutan key di source
+            wanted = set(matched)
+            matched = [key for key in lower_map if key in wanted]
+        for key in matched:
+            levels.extend(_flatten_numeric_levels(lower_map[key]))
     return levels
 
 
@@ -694,6 +1204,51 @@ def _collect_timeframes(payload: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]
     return frames
 
 
+@lru_cache(maxsize=64)
+def _slot_fields(cls: type) -> tuple[str, ...]:
+    fields: list[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        fields.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(name for name in dict.fromkeys(fields) if not name.startswith("__"))
+
+
+class _DirectiveView(Mapping[str, Any]):
+    """View Mapping read-only atas atribut directive (slots) tanpa menyalin ke dict."""
+
+    __slots__ = ("_target", "_fields")
+
+    def __init__(self, target: Any) -> None:
+        self._target = target
+        self._fields = _slot_fields(type(target))
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            try:
+                return getattr(self._target, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields and hasattr(self._target, key)  # type: ignore[arg-type]
+
+    def __iter__(self):
+        target = self._target
+        return (name for name in self._fields if hasattr(target, name))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def _directive_mapping(directive: Any) -> Mapping[str, Any]:
+    # Directive dataclass(slots=True) tidak punya __dict__; objek biasa cukup dibaca via vars().
+    try:
+        return vars(directive)
+    except TypeError:
+        return _DirectiveView(directive)
+
+
 def _collect_timeframe_signals(directive: "AGIReasoningOutput") -> list[TimeframeSignal]:
     overrides: Dict[str, Mapping[str, Any]] = {}
     metrics = getattr(directive, "timeframe_metrics", None)
@@ -707,33 +1262,19 @@ def _collect_timeframe_signals(directive: "AGIReasoningOutput") -> list[Timefram
         base_sources.append(directive.final_report_data)
     if isinstance(directive.twms_payload, Mapping):
         base_sources.append(directive.twms_payload)
-    base_sources.append(vars(directive))
+    base_sources.append(_directive_mapping(directive))
 
     signals: list[TimeframeSignal] = []
     processed: set[str] = set()
+    lower_maps: Dict[int, Dict[str, Any]] = {}
 
     def gather(timeframe: str) -> None:
         tf_upper = timeframe.upper()
         extra = overrides.get(tf_upper)
         sources = [extra, *base_sources] if extra else base_sources
-        prefix = tf_upper.lower()
         values: Dict[str, Any] = {}
-        for metric_name, suffixes in _TIMEFRAME_METRIC_SUFFIXES.items():
-            candidates: list[str] = []
-            for suffix in suffixes:
-                suffix_lower = suffix.lower()
-                candidates.extend(
-                    [
-                        f"{prefix}_{suffix_lower}",
-                        f"{prefix}{suffix_lower}",
-                        f"{tf_upper}_{suffix_lower}",
-                        f"{tf_upper}{suffix_lower}",
-                        suffix_lower,
-                        suffix_lower.upper(),
-                    ]
-                )
-            candidates = list(dict.fromkeys(candidates))
-            value = _extract_metric(sources, candidates)
+        for metric_name, candidates in _timeframe_candidates(tf_upper).items():
+            value = _extract_metric(sources, candidates, lower_maps)
             if value is None and extra and metric_name in extra:
                 value = extra[metric_name]
             values[metric_name] = value
@@ -760,7 +1301,12 @@ def _collect_timeframe_signals(directive: "AGIReasoningOutput") -> list[Timefram
     return signals
 
 
-def _extract_metric(sources: Sequence[Mapping[str, Any]], keys: Sequence[str]) -> Any | None:
+def _extract_metric(
+    sources: Sequence[Mapping[str, Any]],
+    keys: Sequence[str],
+    lower_maps: Dict[int, Dict[str, Any]] | None = None,
+) -> Any | None:
+    # lower_maps (opsional): peta key-lowercase per id(source), dipakai ulang antar panggilan
     for source in sources:
         try:
             items = source.items()
@@ -771,7 +1317,12 @@ def _extract_metric(sources: Sequence[Mapping[str, Any]], keys: Sequence[str]) -
                 value = source[key]
                 if value not in (None, ""):
                     return value
-        lower_map = {str(k).lower(): v for k, v in items}
+        if lower_maps is None:
+            lower_map = {str(k).lower(): v for k, v in items}
+        else:
+            lower_map = lower_maps.get(id(source))
+            if lower_map is None:
+                lower_map = lower_maps[id(source)] = {str(k).lower(): v for k, v in items}
         for key in keys:
             lowered = key.lower()
             if lowered in lower_map:
@@ -792,7 +1343,8 @@ def _extract_fta_context(directive: "AGIReasoningOutput") -> Dict[str, Any] | No
         for payload in timeframe_metrics.values():
             if isinstance(payload, Mapping):
                 sources.append(payload)
-    sources.append(dict(vars(directive)))
+    sources.append(_directive_mapping(directive))
+    sources = _lower_sources(sources)
 
     swing_low = _extract_numeric_from_sources(sources, ("swing_low", "recent_low", "range_low", "low"))
     swing_high = _extract_numeric_from_sources(sources, ("swing_high", "recent_high", "range_high", "high"))
@@ -844,6 +1396,127 @@ def _extract_bias(source: Mapping[str, Any], keys: Iterable[str]) -> str | None:
     return None
 
 
+_SINGLETON_LOCK = threading.Lock()
+_CALIBRATION_LOCK = threading.Lock()
+_VAULT_SINGLETON: VaultRiskSync | None = None
+_FEEDBACK_SINGLETON: RiskFeedbackCalibrator | None = None
+
+
+def _get_vault_sync() -> VaultRiskSync:
+    global _VAULT_SINGLETON
+    if _VAULT_SINGLETON is None:
+        with _SINGLETON_LOCK:
+            if _VAULT_SINGLETON is None:
+                _VAULT_SINGLETON = VaultRiskSync()
+    return _VAULT_SINGLETON
+
+
+def _get_feedback() -> RiskFeedbackCalibrator:
+    global _FEEDBACK_SINGLETON
+    if _FEEDBACK_SINGLETON is None:
+        with _SINGLETON_LOCK:
+            if _FEEDBACK_SINGLETON is None:
+                _FEEDBACK_SINGLETON = RiskFeedbackCalibrator(vault_path="data/vault/risk_logs/")
+    return _FEEDBACK_SINGLETON
+
+
+# Default statis report Layer-12 (urutan = urutan key di report bila belum ada).
+_LAYER12_STATIC_DEFAULTS: Dict[str, Any] = {
+    "alignment_score": "-",
+    "trend_alignment": "-",
+    "final_confluence": "-",
+    "sync_status": "-",
+    "entry_delay": "-",
+    "mc_conf": "-",
+    "divergence_conf": "-",
+    "reflex_integrity": "-",
+    "wlwci_adj": "-",
+    "ema_strength": "-",
+    "system_status": "ACTIVE",
+    "final_conclusion": "-",
+}
+
+
+# (key final_data, key sumber) — urutan tuple = urutan key di report
+_MTF_SUMMARY_KEY_MAP = (
+    ("mtf_direction", "direction"),
+    ("mtf_alignment", "alignment_score"),
+    ("mtf_confluence", "final_confluence"),
+    ("mtf_confidence", "confidence"),
+    ("risk_modifier", "risk_modifier"),
+)
+_MTF_RESULT_KEY_MAP = (
+    ("alignment_score", "alignment_score"),
+    ("final_confluence", "final_confluence"),
+    ("risk_modifier", "risk_modifier"),
+    ("mtf_confidence", "confidence"),
+    ("mtf_direction", "direction"),
+    ("mtf_timeframes", "timeframes"),
+)
+_FTA_KEY_MAP = (
+    ("precision_zone", "precision_zone"),
+    ("precision_tolerance", "precision_tolerance"),
+    ("fta_alignment_score", "alignment_score"),
+)
+_PRECISION_RISK_KEY_MAP = tuple(
+    (key, key)
+    for key in (
+        "precision_entry",
+        "precision_entry_price",
+        "precision_stop_loss",
+        "precision_risk_percent",
+        "precision_lot_size",
+        "precision_risk_amount",
+        "precision_note",
+    )
+)
+_PATCH_KEY_MAP = (
+    ("ema_strength", "ema_strength"),
+    ("wlwci_adj", "wlwci_adjusted"),
+    ("wlwci", "wlwci"),
+    ("twms_bias", "twms_bias"),
+    ("wl_base", "wlwci"),
+)
+
+
+def _execution_candidates(
+    final_data: Mapping[str, Any],
+    risk_payload: Mapping[str, Any],
+    core_confidence: float | None,
+    directive: "AGIReasoningOutput",
+) -> tuple[float | None, float | None, float | None, float | None]:
+    """(entry, price_now, rc, wlwci) untuk execution guard; None bila tidak tersedia/NaN."""
+    # risk_payload["entry_price"] sudah di-set dari directive.entry_price. Field directive
+    # tetap lewat _coerce_float: None/NaN dari caller harus berakhir WAIT, bukan TypeError.
+    entry = _coerce_float(final_data.get("entry")) or _coerce_float(directive.entry_price)
+    price = _coerce_float(risk_payload.get("price_now")) or _coerce_float(final_data.get("price_now"))
+    rc = (
+        _coerce_float(final_data.get("rc"))
+        or core_confidence
+        or _coerce_float(directive.confidence)
+    )
+    wlwci = (
+        _coerce_float(final_data.get("wlwci"))
+        or _coerce_float(risk_payload.get("wlwci"))
+        or _coerce_float(risk_payload.get("wlwci_adj"))
+    )
+    if wlwci is None and directive.wlwci is not None:
+        wlwci = _coerce_float(directive.wlwci)
+    return entry, price, rc, wlwci
+
+
+def _merge_defaults(target: Dict[str, Any], defaults: Mapping[str, Any]) -> None:
+    """Setara rangkaian ``target.setdefault(k, v)``: key baru ditambahkan sesuai urutan ``defaults``."""
+    target.update({key: value for key, value in defaults.items() if key not in target})
+
+
+def _merge_mapped(
+    target: Dict[str, Any], source: Mapping[str, Any], key_map: Sequence[tuple[str, str]]
+) -> None:
+    """Setara ``target.setdefault(dst, source.get(src))`` untuk tiap pasangan di ``key_map``."""
+    target.update({dst: source.get(src) for dst, src in key_map if dst not in target})
+
+
 @dataclass(slots=True)
 class VaultSyncResult:
     pair: str
@@ -860,6 +1533,27 @@ class VaultSyncResult:
     fundamental_context: Dict[str, Any] | None = None
 
 
+@dataclass(slots=True)
+class RiskCore:
+    """Field numerik risk_payload yang dibaca berulang setelah mutasi terakhir."""
+
+    entry_price: float | None
+    stop_loss: float | None
+    risk_percent: float | None
+    confidence: float | None
+    lot_size: float | None
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> "RiskCore":
+        return cls(
+            entry_price=_coerce_float(payload.get("entry_price")),
+            stop_loss=_coerce_float(payload.get("stop_loss")),
+            risk_percent=_coerce_float(payload.get("risk_percent")),
+            confidence=_coerce_float(payload.get("confidence")),
+            lot_size=_coerce_float(payload.get("lot_size")),
+        )
+
+
 class VaultSyncProtocol(Protocol):
     def save(self, pair: str, risk_payload: dict[str, Any]) -> str:  # pragma: no cover - interface only
         ...
@@ -874,24 +1568,27 @@ def run_layer_12(
     limit: int = 10,
     adaptive_context: Dict[str, Any] | None = None,
 ) -> VaultSyncResult:
-    vault = vault_sync or VaultRiskSync()
-
+    _register_patches()
+    vault = vault_sync or _get_vault_sync()
+    # Properti pair dihitung sekali untuk seluruh pemanggilan.
+    is_jpy = "JPY" in directive.pair.upper()
     timeframe_signals = _extract_timeframe_signals(directive)
     mtf_summary: Dict[str, Any] | None = None
     if timeframe_signals:
-        integrator = MultiTimeframeIntegrator()
         try:
-            mtf_summary = integrator.compute_alignment_score(timeframe_signals, base_confidence=directive.confidence)
+            mtf_summary = MULTI_TF_INTEGRATOR.compute_alignment_score(
+                timeframe_signals, base_confidence=directive.confidence
+            )
         except ValueError:
             mtf_summary = None
 
-    pip_lookup = pip_value if pip_value is not None else (9.1 if "JPY" in directive.pair.upper() else 10.0)
+    pip_lookup = pip_value if pip_value is not None else (9.1 if is_jpy else 10.0)
 
     timeframe_signals = _collect_timeframe_signals(directive)
     mtf_result: Dict[str, Any] | None = None
     risk_modifier = 1.0
     if timeframe_signals:
-        mtf_result = MultiTimeframeIntegrator().compute_alignment_score(timeframe_signals)
+        mtf_result = MULTI_TF_INTEGRATOR.compute_alignment_score(timeframe_signals)
         modifier_value = _coerce_float(mtf_result.get("risk_modifier"))
         if modifier_value is not None:
             risk_modifier = modifier_value
@@ -904,11 +1601,9 @@ def run_layer_12(
         entry=directive.entry_price,
         sl=directive.stop_loss,
     )
-    fundamental_context: Dict[str, Any] | None = None
-    try:
-        fundamental_context = FUNDAMENTAL_CONTEXT.fetch_context(directive.pair)
-    except Exception as exc:  # pragma: no cover - telemetry only
-        fundamental_context = {"error": str(exc), "pair": directive.pair}
+    # Lookup ber-TTL (lihat _cached_fundamental_context): lebih murah inline daripada
+    # hand-off ke thread pool, dan tidak ada pool yang bisa macet setelah fork().
+    fundamental_context: Dict[str, Any] | None = _cached_fundamental_context(directive.pair)
     if fundamental_context:
         risk_payload["fundamental_context"] = fundamental_context
     fta_context = _extract_fta_context(directive)
@@ -976,20 +1671,18 @@ def run_layer_12(
     if mtf_result:
         risk_payload.setdefault("multi_timeframe", mtf_result)
 
-    log_path = vault.save(directive.pair, risk_payload)
-    print(f"[VAULT SYNC] Risk data saved → {log_path}")
-
     patch_result: Dict[str, Any] | None = None
     if isinstance(directive.twms_payload, dict):
-        patch_input = dict(directive.twms_payload)
+        # Overlay kosong: tulisan jatuh ke dict depan, payload directive tidak disalin / dimutasi.
+        patch_input: ChainMap[str, Any] = ChainMap({}, directive.twms_payload)
         if directive.wlwci is not None:
             patch_input.setdefault("wlwci", directive.wlwci)
         patch_result = TWMS_PATCH.integrate_with_twms(patch_input)
         _log_patch_event(patch_result)
 
-    base_report: Dict[str, Any] = {}
+    base_report: Mapping[str, Any] = {}
     if isinstance(directive.final_report_data, dict):
-        base_report = dict(directive.final_report_data)
+        base_report = ChainMap({}, directive.final_report_data)
 
     timeframe_payload: Mapping[str, Mapping[str, Any]]
     if base_report and isinstance(base_report.get("timeframes"), Mapping):
@@ -1012,8 +1705,10 @@ def run_layer_12(
     if integrator_result:
         _apply_integrator_to_risk(risk_payload, integrator_result)
 
+    # Satu kali simpan, setelah semua mutasi risk_payload (TWMS patch + integrator) selesai.
     log_path = vault.save(directive.pair, risk_payload)
-    print(f"[VAULT SYNC] Risk data saved → {log_path}")
+    core = RiskCore.from_payload(risk_payload)
+    _LAYER12_LOG.info("[VAULT SYNC] Risk data saved → %s", log_path)
 
     adaptive_snapshot: Dict[str, Any] | None = None
     adaptive_log_path: str | None = None
@@ -1025,29 +1720,8 @@ def run_layer_12(
         entry_price = float(adaptive_context.get("entry_price", 0.0))
         stop_loss = float(adaptive_context.get("stop_loss", 0.0))
         balance_ctx = float(adaptive_context.get("balance", DEFAULT_ACCOUNT_BALANCE))
-        pip_value_ctx = float(adaptive_context.get("pip_value", 9.1 if "JPY" in pair else 10.0))
-
-        risk_percent = calculate_dynamic_risk(confidence, mode)
-        if mtf_result:
-            risk_percent *= risk_modifier
-        lot_size = calculate_lot_size(balance_ctx, entry_price, stop_loss, pip_value_ctx, risk_percent * 100)
-        risk_amount = round(balance_ctx * risk_percent, 2)
-        adaptive_snapshot = {
-            "pair": pair,
-            "confidence": round(confidence, 3),
-            "mode": mode,
-            "risk_percent": round(risk_percent * 100, 2),
-            "risk_amount": risk_amount,
-            "lot_size": lot_size,
-            "entry_price": entry_price,
-            "stop_loss": stop_loss,
-            "balance": balance_ctx,
-            "pip_value": pip_value_ctx,
-        }
-        if mtf_result:
-            adaptive_snapshot["risk_modifier"] = round(risk_modifier, 3)
-            adaptive_snapshot["mtf_alignment"] = mtf_result.get("alignment_score")
-            adaptive_snapshot["mtf_confluence"] = mtf_result.get("final_confluence")
+        pip_value_ctx = float(adaptive_context.get("pip_value", _pip_value(pair)))
+
         risk_fraction = calculate_dynamic_risk(confidence, mode)
         quote_to_usd_rate = 1.0
         if not pair.endswith("USD") and pip_value_ctx > 0:
@@ -1071,27 +1745,36 @@ def run_layer_12(
             }
         )
 
-        vault_adaptive = VaultRiskSync()
+        vault_adaptive = _get_vault_sync()
         adaptive_log_path = vault_adaptive.save(pair, adaptive_snapshot)
-        print("[LAYER 12][ADAPTIVE RISK] " f"{pair} → {adaptive_snapshot} (log: {adaptive_log_path})")
+        _LAYER12_LOG.info(
+            "[LAYER 12][ADAPTIVE RISK] %s → %s (log: %s)", pair, adaptive_snapshot, adaptive_log_path
+        )
 
-    feedback = RiskFeedbackCalibrator(vault_path="data/vault/risk_logs/")
-    recent_data = feedback.load_risk_data(limit=limit)
-    calibration_result = feedback.calibrate(recent_data)
-    saved_path = feedback.save_calibration()
+    feedback = _get_feedback()
+    # calibrate() → save_calibration() berbagi state instance; serialisasi antar thread.
+    with _CALIBRATION_LOCK:
+        recent_data = feedback.load_risk_data(limit=limit)
+        calibration_result = feedback.calibrate(recent_data)
+        saved_path = feedback.save_calibration()
 
-    print(f"[FEEDBACK] Calibrated → {calibration_result}")
+    _LAYER12_LOG.info("[FEEDBACK] Calibrated → %s", calibration_result)
     if saved_path:
-        print(f"[FEEDBACK] Snapshot persisted → {saved_path}")
+        _LAYER12_LOG.info("[FEEDBACK] Snapshot persisted → %s", saved_path)
 
     final_data: Dict[str, Any] = dict(base_report)
-    final_data.setdefault("pair", directive.pair)
-    final_data.setdefault("phase", final_data.get("phase", directive.mode))
-    final_data.setdefault("direction", final_data.get("direction", "-"))
-    final_data.setdefault("entry", directive.entry_price)
-    final_data.setdefault("sl", directive.stop_loss)
-    final_data.setdefault("tp1", final_data.get("tp1", "-"))
-    final_data.setdefault("tp2", final_data.get("tp2", "-"))
+    _merge_defaults(
+        final_data,
+        {
+            "pair": directive.pair,
+            "phase": directive.mode,
+            "direction": "-",
+            "entry": directive.entry_price,
+            "sl": directive.stop_loss,
+            "tp1": "-",
+            "tp2": "-",
+        },
+    )
     if fundamental_context:
         final_data.setdefault("fundamental_context", fundamental_context)
 
@@ -1101,58 +1784,47 @@ def run_layer_12(
     if mtf_summary:
         if final_data.get("direction") in {None, "-", ""}:
             final_data["direction"] = mtf_summary.get("direction", final_data.get("direction"))
-        final_data.setdefault("mtf_direction", mtf_summary.get("direction"))
-        final_data.setdefault("mtf_alignment", mtf_summary.get("alignment_score"))
-        final_data.setdefault("mtf_confluence", mtf_summary.get("final_confluence"))
-        final_data.setdefault("mtf_confidence", mtf_summary.get("confidence"))
-        final_data.setdefault("risk_modifier", mtf_summary.get("risk_modifier"))
-
-    risk_percent_value = risk_payload.get("risk_percent")
-    risk_display: Any
-    if isinstance(risk_percent_value, (int, float)):
-        risk_display = f"{risk_percent_value:.2f}%"
-    else:
-        risk_display = risk_percent_value or "-"
-
-    final_data.setdefault("lot", risk_payload.get("lot_size", "-"))
-    final_data.setdefault("risk", final_data.get("risk", risk_display))
-    final_data.setdefault("rr", final_data.get("rr", "-"))
-    final_data.setdefault("confidence", round(directive.confidence, 3))
-    final_data.setdefault("mode", directive.mode)
-    final_data.setdefault(
-        "exec_status", final_data.get("exec_status", risk_payload.get("mode", "PENDING"))
+        _merge_mapped(final_data, mtf_summary, _MTF_SUMMARY_KEY_MAP)
+
+    # Format risk hanya bila report belum membawa field "risk" (nilai default dibuang bila ada).
+    risk_display: Any = None
+    if "risk" not in final_data:
+        risk_percent_value = risk_payload.get("risk_percent")
+        if isinstance(risk_percent_value, (int, float)):
+            risk_display = f"{risk_percent_value:.2f}%"
+        else:
+            risk_display = risk_percent_value or "-"
+
+    _merge_defaults(
+        final_data,
+        {
+            "lot": risk_payload.get("lot_size", "-"),
+            "risk": risk_display,
+            "rr": "-",
+            "confidence": round(directive.confidence, 3),
+            "mode": directive.mode,
+            "exec_status": risk_payload.get("mode", "PENDING"),
+        },
     )
 
-    if isinstance(risk_payload.get("confidence"), (int, float)):
-        final_data.setdefault("rc", risk_payload.get("confidence"))
-    final_data.setdefault("integrity", final_data.get("integrity", "-"))
+    if "rc" not in final_data and isinstance(rc_value := risk_payload.get("confidence"), (int, float)):
+        final_data["rc"] = rc_value
+    final_data.setdefault("integrity", "-")
 
     if fta_result:
-        final_data.setdefault("precision_zone", fta_result.get("precision_zone"))
-        final_data.setdefault("precision_tolerance", fta_result.get("precision_tolerance"))
-        final_data.setdefault("fta_alignment_score", fta_result.get("alignment_score"))
+        _merge_mapped(final_data, fta_result, _FTA_KEY_MAP)
         final_data.setdefault("fta_layer10", fta_result)
-        final_data.setdefault("precision_entry", risk_payload.get("precision_entry"))
-        final_data.setdefault("precision_entry_price", risk_payload.get("precision_entry_price"))
-        final_data.setdefault("precision_stop_loss", risk_payload.get("precision_stop_loss"))
-        final_data.setdefault("precision_risk_percent", risk_payload.get("precision_risk_percent"))
-        final_data.setdefault("precision_lot_size", risk_payload.get("precision_lot_size"))
-        final_data.setdefault("precision_risk_amount", risk_payload.get("precision_risk_amount"))
-        final_data.setdefault("precision_note", risk_payload.get("precision_note"))
+        _merge_mapped(final_data, risk_payload, _PRECISION_RISK_KEY_MAP)
 
     if patch_result:
-        final_data.setdefault("ema_strength", patch_result.get("ema_strength"))
-        final_data.setdefault("wlwci_adj", patch_result.get("wlwci_adjusted"))
-        final_data.setdefault("wlwci", patch_result.get("wlwci"))
-        final_data.setdefault("twms_bias", patch_result.get("twms_bias"))
-        final_data.setdefault("wl_base", patch_result.get("wlwci"))
+        _merge_mapped(final_data, patch_result, _PATCH_KEY_MAP)
         if "divergence_confidence" in patch_result:
             final_data.setdefault("divergence_conf", patch_result.get("divergence_confidence"))
 
     if integrator_result:
-        final_data["alignment_score"] = f"{integrator_result['alignment_score']:+.2f}"
-        final_data["trend_alignment"] = f"{integrator_result['trend_alignment']:.2f}"
-        final_data["final_confluence"] = f"{integrator_result['final_confluence']:.2f}"
+        final_data["alignment_score"] = _fmt2(integrator_result["alignment_score"], True)
+        final_data["trend_alignment"] = _fmt2(integrator_result["trend_alignment"])
+        final_data["final_confluence"] = _fmt2(integrator_result["final_confluence"])
         final_data["confidence"] = round(integrator_result["confidence"], 3)
         final_data["mode"] = str(integrator_result["mode"]).title()
         final_data["direction"] = integrator_result["direction"]
@@ -1164,13 +1836,9 @@ def run_layer_12(
         final_data.setdefault("reflex_integrity", adaptive_snapshot.get("confidence"))
 
     if mtf_result:
-        final_data.setdefault("alignment_score", mtf_result.get("alignment_score"))
-        final_data.setdefault("final_confluence", mtf_result.get("final_confluence"))
-        final_data.setdefault("risk_modifier", mtf_result.get("risk_modifier"))
-        final_data.setdefault("mtf_confidence", mtf_result.get("confidence"))
-        final_data.setdefault("mtf_direction", mtf_result.get("direction"))
-        final_data.setdefault("mtf_timeframes", mtf_result.get("timeframes"))
-        final_data.setdefault("mtf_alignment", {k: v for k, v in mtf_result.items() if k != "timeframes"})
+        _merge_mapped(final_data, mtf_result, _MTF_RESULT_KEY_MAP)
+        if "mtf_alignment" not in final_data:
+            final_data["mtf_alignment"] = {k: v for k, v in mtf_result.items() if k != "timeframes"}
         if final_data.get("direction") in {"-", None, ""}:
             final_data["direction"] = mtf_result.get("direction", final_data.get("direction"))
 
@@ -1183,42 +1851,16 @@ def run_layer_12(
     if calibration_payload:
         final_data.setdefault("cognition", calibration_payload.get("new_confidence_weight"))
 
-    final_data.setdefault("alignment_score", "-")
-    final_data.setdefault("trend_alignment", "-")
-    final_data.setdefault("final_confluence", "-")
-    final_data.setdefault("sync_status", "-")
-    final_data.setdefault("entry_delay", "-")
-    final_data.setdefault("mc_conf", final_data.get("mc_conf", "-"))
-    final_data.setdefault("divergence_conf", final_data.get("divergence_conf", "-"))
-    final_data.setdefault("reflex_integrity", final_data.get("reflex_integrity", "-"))
-    final_data.setdefault("wlwci_adj", final_data.get("wlwci_adj", "-"))
-    final_data.setdefault("ema_strength", final_data.get("ema_strength", "-"))
-    final_data.setdefault("system_status", final_data.get("system_status", "ACTIVE"))
-    final_data.setdefault("final_conclusion", final_data.get("final_conclusion", "-"))
+    _merge_defaults(final_data, _LAYER12_STATIC_DEFAULTS)
 
     execution_status = "WAIT"
     execution_note = "Parameter eksekusi tidak lengkap."
-    entry_candidate = (
-        _coerce_float(final_data.get("entry"))
-        or _coerce_float(risk_payload.get("entry_price"))
-        or _coerce_float(directive.entry_price)
-    )
-    price_candidate = _coerce_float(risk_payload.get("price_now")) or _coerce_float(final_data.get("price_now"))
-    rc_candidate = (
-        _coerce_float(final_data.get("rc"))
-        or _coerce_float(risk_payload.get("confidence"))
-        or _coerce_float(directive.confidence)
+    entry_candidate, price_candidate, rc_candidate, wlwci_candidate = _execution_candidates(
+        final_data, risk_payload, core.confidence, directive
     )
-    wlwci_candidate = (
-        _coerce_float(final_data.get("wlwci"))
-        or _coerce_float(risk_payload.get("wlwci"))
-        or _coerce_float(risk_payload.get("wlwci_adj"))
-    )
-    if wlwci_candidate is None and directive.wlwci is not None:
-        wlwci_candidate = _coerce_float(directive.wlwci)
     conf12_candidate = _coerce_float(final_data.get("CONF12")) or _coerce_float(final_data.get("conf12"))
 
-    if entry_candidate is not None and price_candidate is not None and rc_candidate is not None and wlwci_candidate is not None:
+    if None not in (entry_candidate, price_candidate, rc_candidate, wlwci_candidate):
         execution_status, execution_note = _INSTANT_EXECUTION_GUARD.execute(
             pair=directive.pair,
             price_now=float(price_candidate),
@@ -1239,25 +1881,28 @@ def run_layer_12(
 
     try:
         report = generate_final_output(final_data)
-        print(report)
-        journal_dir = Path("vault/journal")
-        journal_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        if _LAYER12_LOG.isEnabledFor(logging.INFO):
+            _LAYER12_LOG.info("%s", report)
+        _ensure_dir(_LAYER12_JOURNAL_DIR)
+        timestamp = strftime("%Y%m%d_%H%M")
         pair_label = str(final_data.get("pair", directive.pair or "UNKNOWN")).replace("/", "")
-        report_path = journal_dir / f"{pair_label}_Layer12_{timestamp}.txt"
-        report_path.write_text(report, encoding="utf-8")
+        report_path = _LAYER12_JOURNAL_DIR / f"{pair_label}_Layer12_{timestamp}.txt"
+        _JOURNAL.replace(report_path, report.encode("utf-8"))
     except Exception:  # pragma: no cover - telemetry only
         pass
 
     try:
         pair_value = directive.pair
-        entry_value = _coerce_float(risk_payload.get("entry_price")) or _coerce_float(final_data.get("entry")) or float(directive.entry_price)
-        stop_value = _coerce_float(risk_payload.get("stop_loss")) or _coerce_float(final_data.get("sl")) or float(directive.stop_loss)
+        entry_value = core.entry_price or _coerce_float(final_data.get("entry")) or float(directive.entry_price)
+        stop_value = core.stop_loss or _coerce_float(final_data.get("sl")) or float(directive.stop_loss)
 
-        pip_factor = 100.0 if "JPY" in pair_value.upper() else 10000.0
-        sl_distance = abs(entry_value - stop_value) * pip_factor if entry_value is not None and stop_value is not None else 0.0
+        sl_distance = (
+            _sl_distance_pips(float(entry_value), float(stop_value), is_jpy)
+            if entry_value is not None and stop_value is not None
+            else 0.0
+        )
 
-        risk_percent_value = _coerce_float(risk_payload.get("risk_percent"))
+        risk_percent_value = core.risk_percent
         if risk_percent_value is None:
             risk_field = final_data.get("risk")
             if isinstance(risk_field, str):
@@ -1266,9 +1911,9 @@ def run_layer_12(
         if risk_percent_value is None:
             risk_percent_value = 0.0
 
-        lot_value = _coerce_float(risk_payload.get("lot_size")) or _coerce_float(final_data.get("lot")) or 0.0
+        lot_value = core.lot_size or _coerce_float(final_data.get("lot")) or 0.0
 
-        conf12_value = _coerce_float(final_data.get("confidence")) or _coerce_float(risk_payload.get("confidence")) or float(directive.confidence)
+        conf12_value = _coerce_float(final_data.get("confidence")) or core.confidence or float(directive.confidence)
 
         note_value = (
             str(
@@ -1319,6 +1964,19 @@ def run_layer_12(
 
 
 ModeLiteral = Literal["normal", "reflexive", "aggressive"]
+_TRADE_BIAS_MAP: Dict[str, str] = {"bullish": "buy", "bearish": "sell"}
+_VALID_DIRECTIONS = frozenset({"buy", "sell", "neutral"})
+_VALID_MODES = frozenset({"normal", "reflexive", "aggressive"})
+# Field VaultSyncResult yang diteruskan ke Layer12Output.diagnostics (bila tidak None)
+_DIAGNOSTIC_FIELDS = (
+    "calibration",
+    "mtf_summary",
+    "adaptive_snapshot",
+    "ema_patch",
+    "integrator",
+    "fta_alignment",
+    "fundamental_context",
+)
 
 
 __all__ = [
@@ -1516,9 +2174,8 @@ class ProtoAGIEngine:
         ) or _detect_bias(result.risk_payload.get("bias"))
         if bias_value is None:
             bias_value = "neutral"
-        bias_map = {"bullish": "buy", "bearish": "sell"}
-        direction = bias_map.get(bias_value, bias_value)
-        if direction not in {"buy", "sell", "neutral"}:
+        direction = _TRADE_BIAS_MAP.get(bias_value, bias_value)
+        if direction not in _VALID_DIRECTIONS:
             direction = "neutral"
 
         confidence = _coerce_float(result.risk_payload.get("confidence"))
@@ -1542,7 +2199,7 @@ class ProtoAGIEngine:
 
         mode_value = str(result.risk_payload.get("mode", directive.mode)).lower()
         mode_literal: ModeLiteral
-        if mode_value in {"normal", "reflexive", "aggressive"}:
+        if mode_value in _VALID_MODES:
             mode_literal = mode_value  # type: ignore[assignment]
         else:
             mode_literal = "normal"
@@ -1559,17 +2216,9 @@ class ProtoAGIEngine:
         )
 
         diagnostics = {
-            key: value
-            for key, value in {
-                "calibration": result.calibration,
-                "mtf_summary": result.mtf_summary,
-                "adaptive_snapshot": result.adaptive_snapshot,
-                "ema_patch": result.ema_patch,
-                "integrator": result.integrator,
-                "fta_alignment": result.fta_alignment,
-                "fundamental_context": result.fundamental_context,
-            }.items()
-            if value is not None
+            field: value
+            for field in _DIAGNOSTIC_FIELDS
+            if (value := getattr(result, field)) is not None
         }
 
         return Layer12Output(
@@ -1593,10 +2242,9 @@ def auto_risk_injection(
     *,
     quote_to_usd_rate: float = 1.0,
 ) -> Dict[str, Any]:
-    normalized_pair = pair.upper()
-    pip_value = 9.1 if "JPY" in normalized_pair else 10.0
-    if not normalized_pair.endswith("USD"):
-        quote_to_usd_rate = pip_value / 10.0
+    normalized_pair, cross_rate = _pair_quote_profile(pair)
+    if cross_rate is not None:
+        quote_to_usd_rate = cross_rate
 
     risk_fraction = calculate_dynamic_risk(confidence, mode)
     snapshot = calculate_adaptive_risk(
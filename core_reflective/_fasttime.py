@@ -0,0 +1,33 @@
+"""
+Reflective timestamp helper
+----------------------------------------
+Timestamp ISO-8601 UTC untuk record log reflektif, diformat paling banyak
+sekali per milidetik. Event dalam milidetik yang sama berbagi string yang
+sama (resolusi log reflektif cukup 1 ms).
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+
+_GRANULARITY_NS = 1_000_000
+# (ns saat format terakhir, isoformat naive, isoformat + "Z") — satu tuple agar update atomik antar thread
+_CACHE: tuple[int, str, str] = (-_GRANULARITY_NS, "", "")
+
+
+def _refresh(now: int) -> tuple[int, str, str]:
+    global _CACHE
+    stamp = datetime.datetime.fromtimestamp(now // 1_000 / 1e6, datetime.timezone.utc)
+    iso = stamp.replace(tzinfo=None).isoformat()
+    _CACHE = cache = (now, iso, iso + "Z")
+    return cache
+
+
+def iso_utc_now(zulu: bool = True) -> str:
+    """Setara ``datetime.utcnow().isoformat()`` (+ ``"Z"`` bila `zulu`), di-cache per 1 ms."""
+    now = time.time_ns()
+    cache = _CACHE
+    if not 0 <= now - cache[0] < _GRANULARITY_NS:  # juga refresh bila jam mundur
+        cache = _refresh(now)
+    return cache[2] if zulu else cache[1]
@@ -0,0 +1,251 @@
+"""
+Reflective log sink
+----------------------------------------
+Append JSONL untuk modul reflektif tanpa open/write/close per event.
+
+Setiap path log mendapat satu `BufferedLogSink`: fd dibuka sekali
+(O_APPEND) dan record dikumpulkan sebagai daftar buffer di userspace.
+Semua batch ditulis oleh satu thread daemon (setiap 50 ms, atau segera
+bila buffer sebuah sink mencapai 64 KB) dan saat interpreter keluar;
+pemanggil `write` tidak pernah menunggu disk kecuali buffer sudah 1 MB
+(flusher tertinggal). Batch ditulis dengan satu `os.writev` (tanpa
+menyalin record ke buffer gabungan). io_uring tidak dipakai: tidak ada
+binding di dependensi proyek, dan writev sudah memberi satu syscall per
+batch.
+
+Flusher dibuat ulang bila mati, termasuk setelah fork() (buffer milik
+parent dibuang di proses anak). Batch yang gagal ditulis tidak di-retry;
+ukurannya dicatat lewat logging dan pemanggil `write` tidak menerima
+exception I/O.
+
+Format: JSONL (default). `TUYUL_LOG_FORMAT=msgpack` (butuh ormsgpack)
+menulis record msgpack dengan prefix panjang 4 byte little-endian
+(`struct.pack("<I", n)`), dan suffix file log diganti ke `.msgpack`.
+Tanpa ormsgpack, env tersebut diabaikan (tetap JSONL).
+
+Dependensi opsional:
+- orjson: serialisasi record JSONL (fallback: json stdlib)
+- ormsgpack: format log biner `TUYUL_LOG_FORMAT=msgpack` (fallback: JSONL)
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import struct
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:  # orjson opsional — fallback ke json stdlib
+    import orjson
+except ImportError:  # pragma: no cover - tergantung environment
+    orjson = None
+
+try:  # ormsgpack opsional — hanya dipakai bila TUYUL_LOG_FORMAT=msgpack
+    import ormsgpack
+except ImportError:  # pragma: no cover - tergantung environment
+    ormsgpack = None
+
+_LOG = logging.getLogger(__name__)
+_BUFFER_SIZE = 1 << 16
+# Batas buffer sebelum `write` menulis sendiri (backpressure bila flusher tertinggal)
+_BACKLOG_LIMIT = 16 * _BUFFER_SIZE
+_FLUSH_INTERVAL = 0.05
+_FLUSH_WAKE = threading.Event()
+_SINKS: Dict[str, "BufferedLogSink"] = {}
+_SINKS_LOCK = threading.Lock()
+_FLUSHER: Optional[threading.Thread] = None
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0)
+_IOV_MAX = 1024
+_HAS_WRITEV = hasattr(os, "writev")
+LOG_FORMAT = (
+    "msgpack"
+    if ormsgpack is not None and os.environ.get("TUYUL_LOG_FORMAT", "").lower() == "msgpack"
+    else "jsonl"
+)
+_MSGPACK_SUFFIX = ".msgpack"
+
+
+if LOG_FORMAT == "msgpack":  # pragma: no cover - tergantung environment
+    _PACK_OPTS = ormsgpack.OPT_SERIALIZE_NUMPY | ormsgpack.OPT_NON_STR_KEYS
+    _pack_len = struct.Struct("<I").pack
+
+    def encode_line(record: Any) -> bytes:
+        """Satu record log: panjang (uint32 LE) + msgpack."""
+        buf = ormsgpack.packb(record, option=_PACK_OPTS)
+        return _pack_len(len(buf)) + buf
+
+elif orjson is not None:
+    _LINE_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def encode_line(record: Any) -> bytes:
+        """Satu record JSONL (UTF-8, diakhiri newline)."""
+        return orjson.dumps(record, option=_LINE_OPTS)
+
+else:
+
+    def encode_line(record: Any) -> bytes:
+        """Satu record JSONL (UTF-8, diakhiri newline)."""
+        return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def ensure_dir(path: str) -> None:
+    """`os.makedirs(path, exist_ok=True)` sekali per proses per direktori."""
+    os.makedirs(path, exist_ok=True)
+
+
+def write_file(path: str | os.PathLike[str], data: bytes) -> None:
+    """Timpa `path` dengan `data` lewat os.open/os.write (tanpa TextIOWrapper)."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, chunks: List[bytes]) -> None:
+    if _HAS_WRITEV:
+        for start in range(0, len(chunks), _IOV_MAX):
+            batch = chunks[start:start + _IOV_MAX]
+            written = os.writev(fd, batch)
+            total = sum(map(len, batch))
+            if written < total:  # pragma: no cover - partial write (disk penuh / sinyal)
+                view = memoryview(b"".join(batch))[written:]
+                while view:
+                    view = view[os.write(fd, view):]
+    else:  # pragma: no cover - platform tanpa writev (mis. Windows)
+        view = memoryview(b"".join(chunks))
+        while view:
+            view = view[os.write(fd, view):]
+
+
+class BufferedLogSink:
+    """Handle append ter-buffer untuk satu file log (thread-safe)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._chunks: List[bytes] = []
+        self._size = 0
+
+    def write(self, data: bytes) -> None:
+        """Tambahkan `data` (sudah diakhiri newline) ke buffer file."""
+        with self._lock:
+            self._chunks.append(data)
+            self._size += len(data)
+            size = self._size
+            if size >= _BACKLOG_LIMIT:
+                self._drain()
+        if size == len(data):
+            # buffer sebelumnya kosong: pastikan ada flusher yang akan menulisnya
+            _ensure_flusher()
+        if _BUFFER_SIZE <= size < _BACKLOG_LIMIT:
+            _FLUSH_WAKE.set()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._drain()
+
+    def close(self) -> None:
+        with self._lock:
+            self._drain()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _drain(self) -> None:
+        # dipanggil dengan self._lock terkunci
+        if not self._chunks:
+            return
+        chunks, self._chunks, self._size = self._chunks, [], 0
+        try:
+            if self._fd is None:
+                ensure_dir(os.fspath(self.path.parent))
+                self._fd = os.open(self.path, _APPEND_FLAGS, 0o644)
+            _write_all(self._fd, chunks)
+        except Exception:
+            # tidak di-retry: writev parsial bisa sudah menulis sebagian batch
+            _LOG.exception(
+                "Reflective log sink gagal menulis %s; %d chunk (%d byte) dibuang",
+                self.path,
+                len(chunks),
+                sum(map(len, chunks)),
+            )
+
+    def _reset_after_fork(self) -> None:
+        # proses anak: lock warisan bisa terkunci; buffer milik parent (parent yang menulis)
+        self._lock = threading.Lock()
+        self._chunks = []
+        self._size = 0
+
+
+def get_sink(path: str | os.PathLike[str]) -> BufferedLogSink:
+    """Sink bersama (per proses) untuk `path` (suffix `.msgpack` pada format msgpack)."""
+    key = os.fspath(path)
+    if LOG_FORMAT == "msgpack":  # pragma: no cover - tergantung environment
+        key = os.path.splitext(key)[0] + _MSGPACK_SUFFIX
+    sink = _SINKS.get(key)
+    if sink is None:
+        with _SINKS_LOCK:
+            sink = _SINKS.get(key)
+            if sink is None:
+                sink = _SINKS[key] = BufferedLogSink(Path(key))
+                _start_flusher()
+    return sink
+
+
+def flush_all_sinks() -> None:
+    """Tulis semua buffer sink ke disk."""
+    for sink in list(_SINKS.values()):
+        try:
+            sink.flush()
+        except Exception:
+            _LOG.exception("Reflective log sink gagal flush %s", sink.path)
+
+
+def _start_flusher() -> None:
+    # dipanggil dengan _SINKS_LOCK terkunci
+    global _FLUSHER
+    if _FLUSHER is None or not _FLUSHER.is_alive():
+        _FLUSHER = threading.Thread(target=_flush_loop, name="reflective-log-flush", daemon=True)
+        _FLUSHER.start()
+
+
+def _ensure_flusher() -> None:
+    flusher = _FLUSHER
+    if flusher is None or not flusher.is_alive():
+        with _SINKS_LOCK:
+            _start_flusher()
+
+
+def _flush_loop() -> None:
+    while True:
+        _FLUSH_WAKE.wait(_FLUSH_INTERVAL)
+        _FLUSH_WAKE.clear()
+        try:
+            flush_all_sinks()
+        except Exception:  # pragma: no cover - flush_all_sinks sudah menangkap per sink
+            _LOG.exception("Reflective log flusher error")
+
+
+def _reset_after_fork() -> None:
+    global _SINKS_LOCK, _FLUSHER, _FLUSH_WAKE
+    _SINKS_LOCK = threading.Lock()
+    _FLUSH_WAKE = threading.Event()
+    _FLUSHER = None
+    for sink in _SINKS.values():
+        sink._reset_after_fork()
+
+
+atexit.register(flush_all_sinks)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
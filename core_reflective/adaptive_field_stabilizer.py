@@ -13,13 +13,28 @@ Fungsi:
 
 from __future__ import annotations
 
-import datetime
-import json
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
+
+from core_reflective._fasttime import iso_utc_now
+from core_reflective._log_sink import encode_line, get_sink
+
 LOG_PATH = Path("data/logs/reflective_field_log.json")
-LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+# Batas gradient (kanan-terbuka) → status field; NaN jatuh ke "Reversal" seperti cascade lama
+_GRADIENT_BOUNDS = (0.02, 0.05)
+_FIELD_STATE_LABELS = ("Accumulation", "Expansion", "Reversal")
+# Versi array untuk jalur batch (np.searchsorted)
+_GRADIENT_THRESHOLDS = np.array(_GRADIENT_BOUNDS)
+_FIELD_STATES = np.array(_FIELD_STATE_LABELS)
+
+# Cluster sinkron (read-only, dibagi antar result; diserialisasi sebagai array JSON)
+_SYNC_FULL = ("Hybrid", "FX", "Kartel", "Journal")
+_SYNC_PART = ("Hybrid", "FX", "Kartel")
+_SYNC_MIN = ("Hybrid", "FX")
 
 
 def adaptive_field_stabilizer(
@@ -29,24 +44,19 @@ def adaptive_field_stabilizer(
 
     gradient = round((abs(alpha - beta) + abs(beta - gamma) + abs(alpha - gamma)) / 3, 5)
 
-    if gradient < 0.02:
-        field_state = "Accumulation"
-    elif gradient < 0.05:
-        field_state = "Expansion"
-    else:
-        field_state = "Reversal"
+    field_state = _FIELD_STATE_LABELS[bisect_right(_GRADIENT_BOUNDS, gradient)]
 
     integrity_index = round(max(0.85, 1.0 - gradient / 0.1), 3)
 
     if integrity_index >= integrity_threshold:
-        sync_cluster = ["Hybrid", "FX", "Kartel", "Journal"]
+        sync_cluster = _SYNC_FULL
     elif integrity_index >= 0.9:
-        sync_cluster = ["Hybrid", "FX", "Kartel"]
+        sync_cluster = _SYNC_PART
     else:
-        sync_cluster = ["Hybrid", "FX"]
+        sync_cluster = _SYNC_MIN
 
     result = {
-        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "timestamp": iso_utc_now(),
         "alpha": alpha,
         "beta": beta,
         "gamma": gamma,
@@ -61,9 +71,45 @@ def adaptive_field_stabilizer(
     return result
 
 
+def adaptive_field_stabilizer_batch(
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    gamma: np.ndarray,
+    integrity_threshold: float = 0.95,
+) -> Dict[str, np.ndarray]:
+    """
+    Versi vektor untuk sweep RGO atas banyak triplet α–β–γ (tanpa logging per baris).
+    Aturan sama dengan `adaptive_field_stabilizer`; `sync_level` = jumlah cluster
+    yang tersinkron (4 = Hybrid/FX/Kartel/Journal, 3 = tanpa Journal, 2 = Hybrid/FX).
+    Pembulatan via `np.round`: pada nilai tepat di tengah (mis. 0.8525) hasil bisa
+    berbeda satu digit terakhir dari `round()` builtin.
+    """
+
+    alpha = np.asarray(alpha, dtype=np.float64)
+    beta = np.asarray(beta, dtype=np.float64)
+    gamma = np.asarray(gamma, dtype=np.float64)
+
+    gradient = np.abs(alpha - beta)
+    gradient += np.abs(beta - gamma)
+    gradient += np.abs(alpha - gamma)
+    gradient = np.round(gradient / 3, 5)
+
+    integrity_index = np.round(np.maximum(0.85, 1.0 - gradient / 0.1), 3)
+    field_state = _FIELD_STATES[np.searchsorted(_GRADIENT_THRESHOLDS, gradient, side="right")]
+    sync_level = np.where(
+        integrity_index >= integrity_threshold, 4, np.where(integrity_index >= 0.9, 3, 2)
+    )
+
+    return {
+        "gradient": gradient,
+        "integrity_index": integrity_index,
+        "field_state": field_state,
+        "sync_level": sync_level,
+    }
+
+
 def _log(data: dict) -> None:
-    with open(LOG_PATH, "a", encoding="utf-8") as file:
-        file.write(json.dumps(data) + "\n")
+    get_sink(LOG_PATH).write(encode_line(data))
 
 
-__all__ = ["adaptive_field_stabilizer"]
+__all__ = ["adaptive_field_stabilizer", "adaptive_field_stabilizer_batch"]
@@ -13,13 +13,18 @@ Fungsi:
 
 from __future__ import annotations
 
-import datetime
-import json
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, Any
 
+from core_reflective._fasttime import iso_utc_now
+from core_reflective._log_sink import encode_line, get_sink
+
 LOG_PATH = Path("data/logs/reflective_trade_precision_log.json")
-LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+# Batas tii (>=) → status presisi
+_TII_BOUNDS = (0.75, 0.9)
+_TII_STATUS = ("Low Precision", "Moderate", "High Precision")
 
 
 def algo_precision_engine_v3_2_production(
@@ -33,10 +38,11 @@ def algo_precision_engine_v3_2_production(
     precision_factor = round((trq_energy * reflective_intensity) / (1 + deviation), 4)
     tii = round(precision_factor * bias_strength, 3)
 
-    status = "High Precision" if tii >= 0.9 else "Moderate" if tii >= 0.75 else "Low Precision"
+    # tii NaN tetap "Low Precision" (bisect_right akan menaruhnya di label teratas)
+    status = _TII_STATUS[bisect_right(_TII_BOUNDS, tii)] if tii == tii else "Low Precision"
 
     result = {
-        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "timestamp": iso_utc_now(),
         "price": price,
         "vwap": vwap,
         "trq_energy": trq_energy,
@@ -51,8 +57,7 @@ def algo_precision_engine_v3_2_production(
 
 
 def _log(data: Dict[str, Any]) -> None:
-    with open(LOG_PATH, "a", encoding="utf-8") as file:
-        file.write(json.dumps(data) + "\n")
+    get_sink(LOG_PATH).write(encode_line(data))
 
 
 __all__ = ["algo_precision_engine_v3_2_production"]
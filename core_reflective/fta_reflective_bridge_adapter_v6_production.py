@@ -11,12 +11,12 @@ Last Update: January 2026
 
 from __future__ import annotations
 
-import datetime
 import json
-import os
 from pathlib import Path
 from typing import Any, Dict
 
+from core_reflective._fasttime import iso_utc_now
+from core_reflective._log_sink import encode_line, get_sink
 from core_reflective.fusion_reflective_propagation_coefficient_v6_production import (
     FusionReflectivePropagationCoefficient,
 )
@@ -101,15 +101,13 @@ class FTAReflectiveBridgeAdapter:
     def _log_bridge_event(self, data: Dict[str, Any]) -> None:
         """Simpan log ke file runtime."""
 
+        # Timestamp FTA upstream dipakai ulang; jam lokal hanya bila tidak ada
         record = {
-            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "timestamp": data.get("timestamp") or iso_utc_now(zulu=False),
             "event": "FTA_REFLECTIVE_BRIDGE_UPDATE",
             "data": data,
         }
-        os.makedirs(self.output_path.parent, exist_ok=True)
-        with open(self.output_path, "a", encoding="utf-8") as f:
-            json.dump(record, f, ensure_ascii=False)
-            f.write("\n")
+        get_sink(self.output_path).write(encode_line(record))
 
         self.logger.info(f"🔗 Bridge update logged for {data['pair']}")
 
@@ -15,24 +15,30 @@ Output:
 
 from __future__ import annotations
 
+import asyncio
 import json
-import os
-from datetime import datetime
+from bisect import bisect_left
 from typing import Any, Dict
 
-import numpy as np
-
 from core_meta.neural_connector_v6_production import (
     NeuralConnector,
     NeuralEventType,
     RepoMetadata,
+    encode_payload,
+    install_uvloop,
 )
+from core_reflective._fasttime import iso_utc_now
+from core_reflective._log_sink import encode_line, get_sink
 from core_reflective.reflective_logger import log_reflective_event
 from server_api.services.cloud_logger_service import cloud_log_event
 
 
 BRIDGE_LOG_PATH = "data/logs/reflective_trade_alignment_log.json"
 
+# Batas confidence (>) → regime; bisect_left menaruh NaN di "DISTRIBUTION" seperti cascade lama
+_REGIME_BOUNDS = (0.5, 0.75)
+_REGIME_STATES = ("DISTRIBUTION", "ACCUMULATION", "EXPANSION")
+
 
 class FTAReflectiveTradeAlignmentBridge:
     """FTA–Reflective Trade Alignment Consolidator (Layer-14)."""
@@ -81,21 +87,20 @@ class FTAReflectiveTradeAlignmentBridge:
             + (coherence_index * 0.05)
         )
 
-        confidence = np.clip(abs(weighted_bias) * fta_confidence, 0, 1)
-        regime_state = (
-            "EXPANSION"
-            if confidence > 0.75
-            else "ACCUMULATION"
-            if confidence > 0.5
-            else "DISTRIBUTION"
-        )
+        # Clamp skalar [0, 1] tanpa np.clip (NaN tetap NaN seperti np.clip)
+        confidence = abs(weighted_bias) * fta_confidence
+        if confidence > 1.0:
+            confidence = 1.0
+        elif confidence < 0.0:
+            confidence = 0.0
+        regime_state = _REGIME_STATES[bisect_left(_REGIME_BOUNDS, confidence)]
 
         trade_mode = (
             "BUY" if weighted_bias > 0.25 else "SELL" if weighted_bias < -0.25 else "WAIT"
         )
 
         result = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": iso_utc_now(zulu=False),
             "weighted_bias": round(float(weighted_bias), 4),
             "confidence": round(float(confidence), 3),
             "regime_state": regime_state,
@@ -126,24 +131,24 @@ class FTAReflectiveTradeAlignmentBridge:
             "timestamp": result["timestamp"],
         }
 
-        await self.neural.publish(
-            event_type=NeuralEventType.SIGNAL_GENERATED,
-            payload=payload,
+        # Payload di-serialize sekali; envelope menyisipkan bytes ini tanpa encode ulang.
+        # Publish Redis dan dua log file (di thread) berjalan bersamaan.
+        await asyncio.gather(
+            self.neural.publish_raw(
+                event_type=NeuralEventType.SIGNAL_GENERATED,
+                payload_json=encode_payload(payload),
+            ),
+            asyncio.to_thread(log_reflective_event, "FTA_TRADE_BROADCAST", payload),
+            asyncio.to_thread(cloud_log_event, "fta.trade_broadcast", payload),
         )
 
-        log_reflective_event("FTA_TRADE_BROADCAST", payload)
-        cloud_log_event("fta.trade_broadcast", payload)
-
     # ================================================================
     # UTILITY
     # ================================================================
 
     @staticmethod
     def _save_log(data: Dict[str, Any]) -> None:
-        os.makedirs(os.path.dirname(BRIDGE_LOG_PATH), exist_ok=True)
-        with open(BRIDGE_LOG_PATH, "a", encoding="utf-8") as file:
-            json.dump(data, file)
-            file.write("\n")
+        get_sink(BRIDGE_LOG_PATH).write(encode_line(data))
 
 
 # ======================================================================
@@ -151,8 +156,6 @@ class FTAReflectiveTradeAlignmentBridge:
 # ======================================================================
 
 if __name__ == "__main__":
-    import asyncio
-
     bridge = FTAReflectiveTradeAlignmentBridge()
 
     async def run_demo():
@@ -168,4 +171,5 @@ if __name__ == "__main__":
         print("🎯 Final Trade Alignment Result:\n", json.dumps(result, indent=2))
         await bridge.stop()
 
+    install_uvloop()
     asyncio.run(run_demo())
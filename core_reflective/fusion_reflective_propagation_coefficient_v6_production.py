@@ -5,18 +5,106 @@ Fusion Reflective Propagation Coefficient v6 (FRPC) — Production Mode.
 
 Bridges Fusion Equilibrium output with TRQ–3D / Meta Coherence layers to compute
 the global reflective synchronization coefficient and state.
+
+Dependensi opsional:
+- numba: JIT untuk kernel numerik FRPC (fallback: Python biasa)
+
+Jalur batch (`fusion_reflective_propagation_coefficient_v6_batch`) memakai
+`np.tanh` atas array dan selalu eksak.
 """
 
 from __future__ import annotations
 
-import datetime
-import json
 import math
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict
+
+import numpy as np
+
+from core_reflective._fasttime import iso_utc_now
+from core_reflective._log_sink import encode_line, get_sink
+
+try:  # numba opsional — kernel FRPC berjalan sebagai Python biasa tanpa numba
+    from numba import njit
+except ImportError:  # pragma: no cover - tergantung environment
+    _NUMBA_AVAILABLE = False
+
+    def _scalar_jit(fn):
+        return fn
+
+else:  # pragma: no cover - tergantung environment
+    _NUMBA_AVAILABLE = True
+    # tanpa fastmath: klasifikasi state di batas threshold harus sama dengan jalur Python
+    _scalar_jit = njit(cache=True)
 
 LOG_PATH = Path("data/logs/reflective_propagation_log.json")
-LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+# FRPC_FAST_TANH=1 → aproksimasi Padé (lihat `_fast_tanh`, galat < 1e-5); default tanh eksak.
+FRPC_EXACT_TANH = os.environ.get("FRPC_FAST_TANH", "") not in {"1", "true", "yes"}
+
+_FRPC_NOTE = "Fusion Reflective Propagation Coefficient v6 – Production Mode"
+_PROPAGATION_STATES = (
+    "Full Reflective Sync",
+    "Partial Reflective Sync",
+    "Reflective Drift Detected",
+    "Desynchronized",
+)
+# Versi array untuk jalur batch (np.searchsorted): batas kiri-tertutup 0.7 / 0.85 / 0.95
+_FRPC_THRESHOLDS = np.array((0.7, 0.85, 0.95))
+_BATCH_STATES = np.array(_PROPAGATION_STATES[::-1] + ("invalid input",))
+_INVALID_STATE = len(_PROPAGATION_STATES)
+
+
+@_scalar_jit
+def _fast_tanh(x):
+    """
+    Padé 9/8 (continued fraction Lambert) untuk tanh, di-clamp ke ±1 di luar |x| > 6.5.
+    Galat absolut maks ≈ 9.4e-6 di seluruh sumbu real (puncak di titik clamp); state
+    FRPC hanya bisa berbeda dari tanh eksak bila frpc berada < 1e-5 dari threshold.
+    """
+    if x > 6.5:
+        return 1.0
+    if x < -6.5:
+        return -1.0
+    x2 = x * x
+    return (
+        x
+        * (34459425.0 + x2 * (4729725.0 + x2 * (135135.0 + x2 * (990.0 + x2))))
+        / (34459425.0 + x2 * (16216200.0 + x2 * (945945.0 + x2 * (13860.0 + 45.0 * x2))))
+    )
+
+
+@_scalar_jit
+def _frpc_core(
+    fusion_score, trq_energy, reflective_intensity, alpha, beta, gamma, integrity_index, exact_tanh
+):
+    """(frpc, alpha_sync, gamma_phase, index state) — index ke `_PROPAGATION_STATES`."""
+    if exact_tanh:
+        fusion_norm = math.tanh(fusion_score)
+        trq_norm = math.tanh(trq_energy)
+        intensity_norm = math.tanh(reflective_intensity)
+    else:
+        fusion_norm = _fast_tanh(fusion_score)
+        trq_norm = _fast_tanh(trq_energy)
+        intensity_norm = _fast_tanh(reflective_intensity)
+
+    alpha_sync = (alpha + beta + gamma) / 3
+    gamma_phase = (alpha - gamma) ** 2 + (beta - alpha) ** 2
+
+    frpc = (
+        (fusion_norm * trq_norm * intensity_norm * alpha_sync) / (1 + gamma_phase)
+    ) * integrity_index
+
+    if frpc >= 0.95:
+        state = 0
+    elif frpc >= 0.85:
+        state = 1
+    elif frpc >= 0.7:
+        state = 2
+    else:
+        state = 3
+    return frpc, alpha_sync, gamma_phase, state
 
 
 def fusion_reflective_propagation_coefficient_v6(
@@ -29,32 +117,30 @@ def fusion_reflective_propagation_coefficient_v6(
     integrity_index: float = 0.97,
 ) -> dict[str, Any]:
     """Compute reflective propagation coefficient across Fusion → TRQ–3D → Meta layers."""
-    inputs = [fusion_score, trq_energy, reflective_intensity]
-    if any(value is None or value <= 0 for value in inputs):
+    if (
+        fusion_score is None
+        or fusion_score <= 0
+        or trq_energy is None
+        or trq_energy <= 0
+        or reflective_intensity is None
+        or reflective_intensity <= 0
+    ):
         return {"status": "invalid input"}
 
-    fusion_norm = math.tanh(fusion_score)
-    trq_norm = math.tanh(trq_energy)
-    intensity_norm = math.tanh(reflective_intensity)
-
-    alpha_sync = (alpha + beta + gamma) / 3
-    gamma_phase = (alpha - gamma) ** 2 + (beta - alpha) ** 2
-
-    frpc = (
-        (fusion_norm * trq_norm * intensity_norm * alpha_sync) / (1 + gamma_phase)
-    ) * integrity_index
-
-    if frpc >= 0.95:
-        propagation_state = "Full Reflective Sync"
-    elif 0.85 <= frpc < 0.95:
-        propagation_state = "Partial Reflective Sync"
-    elif 0.7 <= frpc < 0.85:
-        propagation_state = "Reflective Drift Detected"
-    else:
-        propagation_state = "Desynchronized"
+    frpc, alpha_sync, gamma_phase, state = _frpc_core(
+        float(fusion_score),
+        float(trq_energy),
+        float(reflective_intensity),
+        float(alpha),
+        float(beta),
+        float(gamma),
+        float(integrity_index),
+        FRPC_EXACT_TANH,
+    )
+    propagation_state = _PROPAGATION_STATES[state]
 
     result = {
-        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "timestamp": iso_utc_now(),
         "fusion_score": round(fusion_score, 3),
         "trq_energy": round(trq_energy, 3),
         "reflective_intensity": round(reflective_intensity, 3),
@@ -66,17 +152,62 @@ def fusion_reflective_propagation_coefficient_v6(
         "integrity_index": round(integrity_index, 3),
         "frpc": round(frpc, 3),
         "propagation_state": propagation_state,
-        "note": "Fusion Reflective Propagation Coefficient v6 – Production Mode",
+        "note": _FRPC_NOTE,
     }
 
     _log_to_vault(result)
     return result
 
 
+def fusion_reflective_propagation_coefficient_v6_batch(
+    fusion_score: np.ndarray,
+    trq_energy: np.ndarray,
+    reflective_intensity: np.ndarray,
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    gamma: np.ndarray,
+    integrity_index: np.ndarray | float = 0.97,
+) -> Dict[str, np.ndarray]:
+    """
+    Versi vektor FRPC untuk banyak event sekaligus (tanpa logging per baris).
+    Rumus dan threshold sama dengan `fusion_reflective_propagation_coefficient_v6`;
+    baris dengan input <= 0 / NaN mendapat frpc NaN dan state "invalid input".
+    Nilai tidak dibulatkan.
+    """
+    fusion_score = np.asarray(fusion_score, dtype=np.float64)
+    trq_energy = np.asarray(trq_energy, dtype=np.float64)
+    reflective_intensity = np.asarray(reflective_intensity, dtype=np.float64)
+    alpha = np.asarray(alpha, dtype=np.float64)
+    beta = np.asarray(beta, dtype=np.float64)
+    gamma = np.asarray(gamma, dtype=np.float64)
+
+    alpha_sync = (alpha + beta + gamma) / 3
+    gamma_phase = (alpha - gamma) ** 2 + (beta - alpha) ** 2
+    frpc = np.tanh(fusion_score)
+    frpc *= np.tanh(trq_energy)
+    frpc *= np.tanh(reflective_intensity)
+    frpc *= alpha_sync
+    frpc /= 1 + gamma_phase
+    frpc *= integrity_index
+
+    valid = (fusion_score > 0) & (trq_energy > 0) & (reflective_intensity > 0)
+    state = np.where(
+        valid, np.searchsorted(_FRPC_THRESHOLDS, frpc, side="right"), _INVALID_STATE
+    )
+    return {
+        "frpc": np.where(valid, frpc, np.nan),
+        "alpha_sync": alpha_sync,
+        "gamma_phase": gamma_phase,
+        "propagation_state": _BATCH_STATES[state],
+    }
+
+
 def _log_to_vault(data: dict[str, Any]) -> None:
     """Persist reflective propagation result to the journal vault."""
-    with LOG_PATH.open("a", encoding="utf-8") as file:
-        file.write(json.dumps(data) + "\n")
+    get_sink(LOG_PATH).write(encode_line(data))
 
 
-__all__ = ["fusion_reflective_propagation_coefficient_v6"]
+__all__ = [
+    "fusion_reflective_propagation_coefficient_v6",
+    "fusion_reflective_propagation_coefficient_v6_batch",
+]
@@ -13,12 +13,14 @@ Fungsi:
 
 from __future__ import annotations
 
-import datetime
 import json
-import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
+from core_reflective._fasttime import iso_utc_now
+from core_reflective._log_sink import encode_line, ensure_dir, get_sink, write_file
+
 
 class HybridReflectiveBridgeManager:
     def __init__(self) -> None:
@@ -40,6 +42,10 @@ class HybridReflectiveBridgeManager:
         self.version = "6.0r++"
         self.vault_layer = "Reflective Bridge Layer"
 
+        # Record log yang belum ditulis; di-flush sekali di akhir initialize/sync_all
+        self._pending: list[bytes] = []
+        self._pending_lock = threading.Lock()
+
     # =========================================================
     # 🧩 Initialization
     # =========================================================
@@ -49,11 +55,12 @@ class HybridReflectiveBridgeManager:
         result = {
             "status": "initialized",
             "bridge_state": self.bridge_state,
-            "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+            "timestamp": iso_utc_now(),
             "integrity_index": self.integrity_index,
             "note": "All reflective bridges activated (Reflective–Neural–Quantum).",
         }
         self._log(result)
+        self._flush()
         self._write_vault(result)
         return result
 
@@ -64,33 +71,37 @@ class HybridReflectiveBridgeManager:
         """Synchronize Reflective, Neural, and Quantum layers coherently."""
         self._log({"event": "Starting hybrid reflective synchronization..."})
 
-        reflective_sync = self._sync_reflective_layer()
-        neural_sync = self._sync_neural_layer()
-        quantum_sync = self._sync_quantum_layer()
-
-        coherence_index = round(
-            (
-                reflective_sync["integrity"]
-                + neural_sync["integrity"]
-                + quantum_sync["integrity"]
+        try:
+            reflective_sync = self._sync_reflective_layer()
+            neural_sync = self._sync_neural_layer()
+            quantum_sync = self._sync_quantum_layer()
+
+            coherence_index = round(
+                (
+                    reflective_sync["integrity"]
+                    + neural_sync["integrity"]
+                    + quantum_sync["integrity"]
+                )
+                / 3,
+                3,
             )
-            / 3,
-            3,
-        )
-        sync_state = "Full Sync" if coherence_index >= 0.95 else "Partial Sync"
-
-        result = {
-            "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
-            "reflective_sync": reflective_sync["status"],
-            "neural_sync": neural_sync["status"],
-            "quantum_sync": quantum_sync["status"],
-            "coherence_index": coherence_index,
-            "sync_state": sync_state,
-            "integrity_index": self.integrity_index,
-            "version": self.version,
-        }
-
-        self._log(result)
+            sync_state = "Full Sync" if coherence_index >= 0.95 else "Partial Sync"
+
+            result = {
+                "timestamp": iso_utc_now(),
+                "reflective_sync": reflective_sync["status"],
+                "neural_sync": neural_sync["status"],
+                "quantum_sync": quantum_sync["status"],
+                "coherence_index": coherence_index,
+                "sync_state": sync_state,
+                "integrity_index": self.integrity_index,
+                "version": self.version,
+            }
+
+            self._log(result)
+        finally:
+            # record "Starting..." tetap tertulis walau sinkronisasi gagal
+            self._flush()
         self._write_vault(result)
         return result
 
@@ -132,17 +143,23 @@ class HybridReflectiveBridgeManager:
     # 🧾 Logging & Vault Integration
     # =========================================================
     def _log(self, data: Any) -> None:
-        """Log reflective bridge event to file."""
-        os.makedirs(self.log_path.parent, exist_ok=True)
-        entry = {"timestamp": datetime.datetime.utcnow().isoformat() + "Z", "data": data}
-        with open(self.log_path, "a", encoding="utf-8") as file:
-            file.write(json.dumps(entry) + "\n")
+        """Queue reflective bridge event; written by `_flush` (thread-safe)."""
+        line = encode_line({"timestamp": iso_utc_now(), "data": data})
+        with self._pending_lock:
+            self._pending.append(line)
+
+    def _flush(self) -> None:
+        """Write queued bridge events to the reflective log in one append."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            get_sink(self.log_path).write(b"".join(pending))
 
     def _write_vault(self, data: Dict[str, Any]) -> None:
         """Write sync result to Journal Vault."""
-        os.makedirs(self.vault_sync_path.parent, exist_ok=True)
-        with open(self.vault_sync_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2)
+        ensure_dir(str(self.vault_sync_path.parent))
+        # json.dump ke file teks menulis per token; serialize dulu, lalu satu os.write
+        write_file(self.vault_sync_path, json.dumps(data, indent=2).encode("utf-8"))
 
 
 # =========================================================
@@ -1,10 +1,28 @@
-"""Minimal Reflective Evolution Engine v6 implementation."""
+"""
+Reflective Evolution Engine v6 (Layer-17).
+
+Tracks normalized reflective evolution snapshots (`ingest_feedback`) and runs
+REE feedback cycles that tune the adaptive α–β–γ weights
+(`run_feedback_cycle`). Cycle history is appended as JSONL through the shared
+reflective log sink.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from core_reflective._log_sink import encode_line, get_sink
+from core_reflective.reflective_logger import ReflectiveLogger, log_reflective_event
+
+
+REFLECTIVE_HISTORY_PATH = Path("data/logs/ree_feedback_history.jsonl")
+
+
+def _clamp(value: float, lower: float = 0.0, upper: float = 1.0) -> float:
+    return max(lower, min(upper, value))
 
 
 @dataclass
@@ -20,22 +38,7 @@ class EvolutionSnapshot:
             "timestamp": self.timestamp,
             "reflective_integrity": self.reflective_integrity,
             "meta_weights": self.meta_weights,
-from __future__ import annotations
-
-import json
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any, Dict, Optional
-
-from core_reflective.reflective_logger import ReflectiveLogger, log_reflective_event
-
-
-REFLECTIVE_HISTORY_PATH = Path("data/logs/ree_feedback_history.jsonl")
-
-
-def _clamp(value: float, lower: float = 0.0, upper: float = 1.0) -> float:
-    return max(lower, min(upper, value))
+        }
 
 
 @dataclass
@@ -65,10 +68,20 @@ class FeedbackSnapshot:
 
 
 class ReflectiveEvolutionEngine:
-    """Track reflective evolution feedback and provide normalized snapshots."""
+    """
+    Layer-17 engine that tunes adaptive weights from feedback cycles and
+    tracks normalized reflective evolution snapshots.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        history_path: Path = REFLECTIVE_HISTORY_PATH,
+        logger: Optional[ReflectiveLogger] = None,
+    ) -> None:
         self.snapshots: List[EvolutionSnapshot] = []
+        self.history_path = history_path
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logger or ReflectiveLogger("REE.Engine")
 
     def ingest_feedback(self, feedback: Mapping[str, Any]) -> EvolutionSnapshot:
         reflective_integrity = self._as_float(feedback.get("reflective_integrity"), default=0.0)
@@ -105,16 +118,6 @@ class ReflectiveEvolutionEngine:
     @staticmethod
     def _timestamp() -> str:
         return f"{datetime.utcnow().isoformat()}Z"
-    """Layer-17 engine that tunes adaptive weights from feedback cycles."""
-
-    def __init__(
-        self,
-        history_path: Path = REFLECTIVE_HISTORY_PATH,
-        logger: Optional[ReflectiveLogger] = None,
-    ) -> None:
-        self.history_path = history_path
-        self.history_path.parent.mkdir(parents=True, exist_ok=True)
-        self.logger = logger or ReflectiveLogger("REE.Engine")
 
     def run_feedback_cycle(
         self,
@@ -141,19 +144,18 @@ class ReflectiveEvolutionEngine:
         )
 
         self._persist(snapshot)
-        self.logger.info(
-            (
-                "REE feedback | %s | integrity=%.3f | state=%s | α=%.3f β=%.3f γ=%.3f"
-            )
-            % (
-                pair,
-                snapshot.reflective_integrity,
-                snapshot.meta_state,
-                snapshot.alpha,
-                snapshot.beta,
-                snapshot.gamma,
-            )
+        # ReflectiveLogger tidak punya .info(); pesan dicatat sebagai kategori "info"
+        message = (
+            "REE feedback | %s | integrity=%.3f | state=%s | α=%.3f β=%.3f γ=%.3f"
+        ) % (
+            pair,
+            snapshot.reflective_integrity,
+            snapshot.meta_state,
+            snapshot.alpha,
+            snapshot.beta,
+            snapshot.gamma,
         )
+        self.logger.log({"message": message}, category="info")
         log_reflective_event("REE_FEEDBACK", snapshot.to_dict())
         return snapshot.to_dict()
 
@@ -186,7 +188,10 @@ class ReflectiveEvolutionEngine:
         gamma = _clamp(adaptive_gain + (bias_shift * 0.5), 0.85, 1.25)
         return round(alpha, 3), round(beta, 3), round(gamma, 3)
 
+    def close(self) -> None:
+        """Flush buffered history records to disk (the shared handle stays open)."""
+        get_sink(self.history_path).flush()
+
     def _persist(self, snapshot: FeedbackSnapshot) -> None:
-        with open(self.history_path, "a", encoding="utf-8") as handle:
-            json.dump(snapshot.to_dict(), handle, ensure_ascii=False)
-            handle.write("\n")
+        # history fd is opened once per process; records are batched by the reflective sink
+        get_sink(self.history_path).write(encode_line(snapshot.to_dict()))
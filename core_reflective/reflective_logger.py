@@ -9,16 +9,18 @@ Fungsi:
   • Logging sistem reflektif lintas modul (Cycle, Evolution, Audit, Trade, Meta)
   • Otomatis menyimpan ke struktur Vault (Journal Vault)
   • Format JSONL untuk real-time streaming dan sinkronisasi GCP
+  • Append lewat sink ter-buffer bersama (core_reflective._log_sink): satu
+    writev per batch, bukan open/write/close per event
 """
 
 from __future__ import annotations
 
 import datetime
-import json
-import os
 from pathlib import Path
 from typing import Any, Dict
 
+from core_reflective._log_sink import encode_line, get_sink
+
 
 ROOT_LOG_DIR = Path("data/logs")
 VAULT_LOG_DIR = Path("quad_vaults/journal_vault/session_logs")
@@ -39,8 +41,9 @@ class ReflectiveLogger:
             "category": category,
             "data": data,
         }
-        self._append_json(self.log_path, entry)
-        self._append_json(self.vault_path, entry)
+        line = encode_line(entry)
+        get_sink(self.log_path).write(line)
+        get_sink(self.vault_path).write(line)
 
     def cycle_log(self, cycle_data: Dict[str, Any]) -> None:
         self.log(cycle_data, category="cycle")
@@ -58,15 +61,15 @@ class ReflectiveLogger:
         self.log(meta_data, category="meta")
 
     def clear(self) -> None:
-        if self.log_path.exists():
-            self.log_path.unlink()
-        if self.vault_path.exists():
-            self.vault_path.unlink()
+        # tulis + tutup buffer dulu supaya record tertunda tidak membuat ulang file;
+        # hapus sink.path (bisa `.msgpack`), bukan log_path/vault_path apa adanya
+        for path in (self.log_path, self.vault_path):
+            sink = get_sink(path)
+            sink.close()
+            sink.path.unlink(missing_ok=True)
 
     def _append_json(self, path: Path, data: Dict[str, Any]) -> None:
-        os.makedirs(path.parent, exist_ok=True)
-        with open(path, "a", encoding="utf-8") as file:
-            file.write(json.dumps(data) + "\n")
+        get_sink(path).write(encode_line(data))
 
 
 def get_reflective_logger(module_name: str) -> ReflectiveLogger:
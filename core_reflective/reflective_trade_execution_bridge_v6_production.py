@@ -22,6 +22,9 @@ import random
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
+from core_meta._state_io import write_json_atomic
+from core_reflective._log_sink import encode_line, get_sink
+
 # === CONFIG ===
 TRADE_PLAN_PATH = Path("data/logs/reflective_trade_plan_log.json")
 EXEC_LOG_PATH = Path("data/logs/reflective_trade_execution_log.json")
@@ -133,8 +136,7 @@ def _parse_json_lines(lines: list[str]) -> list[Dict[str, Any]]:
 
 
 def _write_log(data: Dict[str, Any]) -> None:
-    with open(EXEC_LOG_PATH, "a", encoding="utf-8") as file:
-        file.write(json.dumps(data) + "\n")
+    get_sink(EXEC_LOG_PATH).write(encode_line(data))
 
 
 def _write_audit(data: Dict[str, Any]) -> None:
@@ -148,8 +150,8 @@ def _write_audit(data: Dict[str, Any]) -> None:
         "pnl": data["result"]["pnl"],
         "outcome": data["result"]["outcome"],
     }
-    with open(AUDIT_PATH, "w", encoding="utf-8") as file:
-        json.dump(audit, file, indent=2)
+    # orjson (indent=2) + tmp/os.replace, sama seperti snapshot state REE
+    write_json_atomic(str(AUDIT_PATH), audit)
 
 
 def reflective_trade_execution_bridge_v6_production(
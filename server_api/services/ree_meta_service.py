@@ -6,11 +6,11 @@ and persists learning curves plus feedback snapshots to the vault manifests.
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+from core_meta._state_io import STATE_SINK
 from core_meta.neural_bridge_hub_v6 import NeuralBridgeHubV6
 from core_meta.ree_adaptive_analysis import REEAdaptiveAnalysis
 from core_meta.ree_feedback_interface import REEFeedbackInterface
@@ -96,16 +96,11 @@ class REEMetaService:
 
 	# 🧩 4️⃣ Simpan Hasil Pembelajaran
 	def _save_learning_curve(self, result: Dict[str, Any]) -> None:
-		self.learning_curve_path.parent.mkdir(parents=True, exist_ok=True)
-		with open(self.learning_curve_path, "a", encoding="utf-8") as file:
-			json.dump(result, file)
-			file.write("\n")
+		STATE_SINK.append(str(self.learning_curve_path), result)
 
 	# 🧩 5️⃣ Simpan Meta Feedback
 	def _save_integrity_feedback(self, result: Dict[str, Any]) -> None:
-		self.integrity_path.parent.mkdir(parents=True, exist_ok=True)
-		with open(self.integrity_path, "w", encoding="utf-8") as file:
-			json.dump(result, file, indent=2)
+		STATE_SINK.submit(str(self.integrity_path), result)
 
 
 # Runtime helper
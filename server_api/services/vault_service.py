@@ -150,10 +150,11 @@ class VaultService:
 	# ============================================================
 	def _evaluate_meta_layer(self) -> Dict[str, Any]:
 		ree_snapshot = self.ree_controller.evaluate_integrity()
+		state = self.ree_controller.state
 		drift_values = {
-			"alpha": float(self.ree_controller.state.get("alpha_drift", 0.0)),
-			"beta": float(self.ree_controller.state.get("beta_drift", 0.0)),
-			"gamma": float(self.ree_controller.state.get("gamma_drift", 0.0)),
+			"alpha": float(state.alpha_drift),
+			"beta": float(state.beta_drift),
+			"gamma": float(state.gamma_drift),
 		}
 		drift_index = round(sum(abs(value) for value in drift_values.values()) / 3, 3)
 
@@ -1 +1,87 @@
-"""Skeleton placeholder."""
+from __future__ import annotations
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_reflective import fusion_reflective_propagation_coefficient_v6_production as frpc  # noqa: E402
+from core_reflective._log_sink import flush_all_sinks  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _log_to_tmp(tmp_path, monkeypatch):
+    monkeypatch.setattr(frpc, "LOG_PATH", tmp_path / "reflective_propagation_log.json")
+    yield
+    flush_all_sinks()
+
+
+def test_fast_tanh_error_bound() -> None:
+    # termasuk titik clamp ±6.5 dan ekor di luar domain coherence
+    xs = np.concatenate((np.linspace(-20.0, 20.0, 400_001), [-6.5, 6.5, 0.0]))
+    worst = max(abs(frpc._fast_tanh(float(x)) - math.tanh(x)) for x in xs)
+    assert worst < 1e-5
+
+
+def test_fast_tanh_keeps_state_away_from_thresholds() -> None:
+    rng = random.Random(11)
+    for _ in range(5_000):
+        args = (
+            rng.uniform(0.01, 8.0),
+            rng.uniform(0.01, 8.0),
+            rng.uniform(0.01, 8.0),
+            rng.uniform(0.8, 1.1),
+            rng.uniform(0.8, 1.1),
+            rng.uniform(0.8, 1.1),
+            rng.uniform(0.9, 1.0),
+        )
+        exact = frpc._frpc_core(*args, True)
+        fast = frpc._frpc_core(*args, False)
+        assert fast[0] == pytest.approx(exact[0], abs=5e-5)
+        if min(abs(exact[0] - bound) for bound in (0.7, 0.85, 0.95)) > 5e-5:
+            assert fast[3] == exact[3]
+
+
+def test_batch_matches_scalar() -> None:
+    rng = random.Random(3)
+    rows = [
+        (
+            rng.uniform(0.5, 4.0),
+            rng.uniform(0.5, 4.0),
+            rng.uniform(0.5, 4.0),
+            rng.uniform(0.9, 1.05),
+            rng.uniform(0.9, 1.05),
+            rng.uniform(0.9, 1.05),
+        )
+        for _ in range(200)
+    ]
+    columns = [np.array(column) for column in zip(*rows)]
+    batch = frpc.fusion_reflective_propagation_coefficient_v6_batch(*columns)
+
+    for index, row in enumerate(rows):
+        scalar = frpc.fusion_reflective_propagation_coefficient_v6(*row)
+        assert round(float(batch["frpc"][index]), 3) == pytest.approx(scalar["frpc"], abs=1e-3)
+        assert batch["propagation_state"][index] == scalar["propagation_state"]
+
+
+def test_batch_marks_invalid_rows() -> None:
+    batch = frpc.fusion_reflective_propagation_coefficient_v6_batch(
+        [2.0, 0.0, float("nan")], [3.0, 1.0, 1.0], [2.5, 1.0, 1.0], 1.0, 0.99, 1.0
+    )
+
+    assert list(batch["propagation_state"]) == [
+        "Partial Reflective Sync",
+        "invalid input",
+        "invalid input",
+    ]
+    assert np.isnan(batch["frpc"][1:]).all()
+    assert frpc.fusion_reflective_propagation_coefficient_v6(0.0, 1.0, 1.0, 1, 1, 1) == {
+        "status": "invalid input"
+    }
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_reflective._log_sink import get_sink  # noqa: E402
+from core_reflective.hybrid_reflective_bridge_manager import (  # noqa: E402
+    HybridReflectiveBridgeManager,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    bridge = HybridReflectiveBridgeManager()
+    bridge.log_path = tmp_path / "reflective_bridge_log.json"
+    bridge.vault_sync_path = tmp_path / "vault" / "reflective_bridge_state.json"
+    return bridge
+
+
+def _read_log(bridge: HybridReflectiveBridgeManager) -> list[dict]:
+    get_sink(bridge.log_path).flush()
+    return [json.loads(line) for line in bridge.log_path.read_text().splitlines()]
+
+
+def test_sync_all_logs_and_writes_vault(manager) -> None:
+    result = manager.sync_all()
+
+    records = _read_log(manager)
+    assert [record["data"] for record in records] == [
+        {"event": "Starting hybrid reflective synchronization..."},
+        result,
+    ]
+    assert json.loads(manager.vault_sync_path.read_text()) == result
+
+
+def test_sync_all_failure_still_flushes_start_record(manager, monkeypatch) -> None:
+    def broken() -> dict:
+        raise RuntimeError("neural hub offline")
+
+    monkeypatch.setattr(manager, "_sync_neural_layer", broken)
+    with pytest.raises(RuntimeError):
+        manager.sync_all()
+
+    assert manager._pending == []
+    assert [record["data"] for record in _read_log(manager)] == [
+        {"event": "Starting hybrid reflective synchronization..."}
+    ]
+
+
+def test_concurrent_log_and_flush_lose_nothing(manager) -> None:
+    per_thread = 500
+
+    def produce(worker: int) -> None:
+        for n in range(per_thread):
+            manager._log({"worker": worker, "n": n})
+            if n % 50 == 0:
+                manager._flush()
+
+    threads = [threading.Thread(target=produce, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    manager._flush()
+
+    assert len(_read_log(manager)) == 4 * per_thread
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_reflective import _log_sink  # noqa: E402
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_sink_appends_encoded_lines(tmp_path) -> None:
+    path = tmp_path / "logs" / "events.json"
+    sink = _log_sink.get_sink(path)
+    assert _log_sink.get_sink(str(path)) is sink
+
+    sink.write(_log_sink.encode_line({"n": 1}))
+    sink.write(_log_sink.encode_line({"n": 2}))
+    sink.flush()
+
+    assert [json.loads(line) for line in path.read_text().splitlines()] == [{"n": 1}, {"n": 2}]
+
+
+def test_failed_batch_is_logged_and_flusher_survives(tmp_path, caplog) -> None:
+    good = tmp_path / "good.json"
+    with caplog.at_level(logging.ERROR, logger=_log_sink.__name__):
+        # null byte di path → ValueError (bukan OSError) saat os.open
+        _log_sink.get_sink(str(tmp_path / "bad\0name.json")).write(b"lost\n")
+        _log_sink.flush_all_sinks()
+
+    assert any("dibuang" in record.getMessage() for record in caplog.records)
+
+    _log_sink.get_sink(good).write(b"kept\n")
+    # tanpa flush eksplisit: flusher latar belakang masih hidup dan menulis
+    assert _wait_for(lambda: good.exists() and good.read_bytes() == b"kept\n")
+    assert _log_sink._FLUSHER is not None and _log_sink._FLUSHER.is_alive()
+
+
+def test_dead_flusher_is_restarted(tmp_path, monkeypatch) -> None:
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    monkeypatch.setattr(_log_sink, "_FLUSHER", dead)
+
+    path = tmp_path / "restart.json"
+    _log_sink.get_sink(path).write(b"after-restart\n")
+
+    assert _log_sink._FLUSHER is not dead and _log_sink._FLUSHER.is_alive()
+    assert _wait_for(lambda: path.exists() and path.read_bytes() == b"after-restart\n")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() tidak tersedia")
+def test_forked_child_does_not_rewrite_parent_buffer(tmp_path) -> None:
+    path = tmp_path / "fork.json"
+    sink = _log_sink.get_sink(path)
+    sink.write(b"parent\n")
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - dijalankan di proses anak
+        code = 1
+        try:
+            _log_sink.get_sink(path).write(b"child\n")
+            _log_sink.flush_all_sinks()
+            code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+
+    sink.flush()
+    assert sorted(path.read_text().splitlines()) == ["child", "parent"]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+pytest.importorskip("pydantic")
+pytest.importorskip("redis")
+
+from core_meta import neural_connector_v6_production as connector  # noqa: E402
+
+_MODULE_PATH = PROJECT_ROOT / "core_meta" / "neural_connector_v6_production.py"
+
+
+def _load_without_msgspec(monkeypatch):
+    # salinan modul terpisah dengan msgspec "tidak terpasang" → jalur Pydantic
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    spec = importlib.util.spec_from_file_location("_neural_connector_no_msgspec", _MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(params=["default", "pydantic"])
+def backend(request, monkeypatch):
+    if request.param == "pydantic":
+        return _load_without_msgspec(monkeypatch)
+    return connector
+
+
+def test_decode_event_returns_neural_event(backend) -> None:
+    raw = backend._encode_event(
+        backend.NeuralEventType.META_FEEDBACK, "repo-a", {"score": 0.9}, correlation_id="c-1"
+    )
+    event = backend._decode_event(raw)
+
+    assert isinstance(event, backend.NeuralEvent)
+    assert event == backend.NeuralEvent.model_validate_json(raw)
+    dumped = event.model_dump()
+    assert dumped["event_type"] is backend.NeuralEventType.META_FEEDBACK
+    assert dumped["payload"] == {"score": 0.9}
+    assert dumped["correlation_id"] == "c-1"
+
+
+def test_decode_event_fills_defaults(backend) -> None:
+    event = backend._decode_event(
+        b'{"event_type":"meta.feedback","source_repo_id":"repo-a","payload":{}}'
+    )
+
+    assert isinstance(event, backend.NeuralEvent)
+    assert len(event.event_id) == 24
+    assert event.timestamp is not None
+    assert event.ttl == 300
+
+
+def test_decode_event_rejects_invalid_payload(backend) -> None:
+    with pytest.raises(Exception):
+        backend._decode_event(b'{"event_type":"unknown","source_repo_id":"repo-a","payload":{}}')
+
+
+def test_import_leaves_event_loop_policy_alone() -> None:
+    policy = asyncio.get_event_loop_policy()
+    spec = importlib.util.spec_from_file_location("_neural_connector_reimport", _MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_install_uvloop_is_explicit_opt_in() -> None:
+    uvloop = pytest.importorskip("uvloop")
+    policy = asyncio.get_event_loop_policy()
+    try:
+        assert connector.install_uvloop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+    finally:
+        asyncio.set_event_loop_policy(policy)
+
+
+def _connector() -> "connector.NeuralConnector":
+    meta = connector.RepoMetadata(
+        repo_id="repo-self",
+        repo_name="test",
+        repo_type="test",
+        version="0",
+        layer="test",
+        capabilities=[],
+    )
+    return connector.NeuralConnector(meta, logger=logging.getLogger("test.neural"))
+
+
+def _raw_event() -> bytes:
+    return connector._encode_event(connector.NeuralEventType.META_FEEDBACK, "repo-other", {})
+
+
+def test_dispatch_runs_handlers_in_registration_order() -> None:
+    node = _connector()
+    calls: list[str] = []
+
+    async def first(event) -> None:
+        calls.append("async-1")
+
+    def second(event) -> None:
+        calls.append("sync-2")
+
+    async def third(event) -> None:
+        calls.append("async-3")
+
+    for handler in (first, second, third):
+        node.on(connector.NeuralEventType.META_FEEDBACK, handler)
+    asyncio.run(node._dispatch_event(_raw_event()))
+
+    # body coroutine baru jalan saat di-gather, tetapi pemanggilan handler berurutan
+    assert node.handlers[connector.NeuralEventType.META_FEEDBACK] == [first, second, third]
+    assert calls == ["sync-2", "async-1", "async-3"]
+
+
+def test_dispatch_propagates_sync_handler_error_after_pending() -> None:
+    node = _connector()
+    done: list[str] = []
+
+    async def before(event) -> None:
+        done.append("before")
+
+    def broken(event) -> None:
+        raise RuntimeError("sync boom")
+
+    def after(event) -> None:
+        done.append("after")
+
+    for handler in (before, broken, after):
+        node.on(connector.NeuralEventType.META_FEEDBACK, handler)
+    with pytest.raises(RuntimeError, match="sync boom"):
+        asyncio.run(node._dispatch_event(_raw_event()))
+
+    # seperti sebelumnya: handler setelah yang gagal tidak dipanggil
+    assert done == ["before"]
+
+
+def test_dispatch_propagates_async_handler_error() -> None:
+    node = _connector()
+    done: list[str] = []
+
+    async def broken(event) -> None:
+        raise ValueError("async boom")
+
+    async def sibling(event) -> None:
+        done.append("sibling")
+
+    node.on(connector.NeuralEventType.META_FEEDBACK, broken)
+    node.on(connector.NeuralEventType.META_FEEDBACK, sibling)
+    with pytest.raises(ValueError, match="async boom"):
+        asyncio.run(node._dispatch_event(_raw_event()))
+    assert done == ["sibling"]
+
+
+def test_dispatch_ignores_own_events() -> None:
+    node = _connector()
+    node.on(connector.NeuralEventType.META_FEEDBACK, lambda event: pytest.fail("own event"))
+    raw = connector._encode_event(connector.NeuralEventType.META_FEEDBACK, "repo-self", {})
+    asyncio.run(node._dispatch_event(raw))
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_orchestrator import proto_agi_engine_v533 as engine  # noqa: E402
+
+
+def test_calibrate_mean_matches_sequential_sum() -> None:
+    rng = random.Random(5)
+    calibrator = engine.RiskFeedbackCalibrator()
+    for size in (1, 7, 8, 9, 64, 1_000):
+        data = [{"confidence": rng.uniform(0.0, 1.0)} for _ in range(size)]
+        expected = sum(entry["confidence"] for entry in data) / size
+        summary = calibrator.calibrate(data)
+        # pairwise summation NumPy: sama sampai pembulatan floating-point terakhir
+        assert summary.new_confidence_weight == pytest.approx(expected, rel=1e-12, abs=0.0)
+
+
+def test_calibrate_defaults_and_bad_values() -> None:
+    calibrator = engine.RiskFeedbackCalibrator()
+    assert calibrator.calibrate([]).new_confidence_weight == 0.75
+    summary = calibrator.calibrate([{"confidence": "bad"}, {"confidence": None}, {"confidence": 0.9}, {}])
+    assert summary.new_confidence_weight == pytest.approx(0.9 / 4)
+
+
+def _directive(**overrides) -> engine.AGIReasoningOutput:
+    fields = {
+        "pair": "EURUSD",
+        "confidence": 0.8,
+        "mode": "balanced",
+        "entry_price": 1.1,
+        "stop_loss": 1.09,
+        "wlwci": 0.91,
+        "final_report_data": {"swing_low": 1.08, "swing_high": 1.12, "H4_trend": "bullish"},
+        "timeframe_metrics": {"H1": {"trend": "bearish", "ema_bias": "down"}},
+    }
+    fields.update(overrides)
+    return engine.AGIReasoningOutput(**fields)
+
+
+def test_alignment_score_serialises_slots_signals() -> None:
+    # TimeframeSignal memakai slots → tidak ada __dict__ (dulu AttributeError)
+    signals = [
+        engine.TimeframeSignal("H4", bias="bullish", confidence=0.9),
+        engine.TimeframeSignal("H1", bias="bullish", confidence=None),
+    ]
+    result = engine.MultiTimeframeIntegrator().compute_alignment_score(signals)
+
+    assert result["alignment_score"] == pytest.approx(0.9)
+    assert result["direction"] == "bullish"
+    assert [signal["timeframe"] for signal in result["signals"]] == ["H4", "H1"]
+    assert list(result["signals"][0]) == list(engine.TimeframeSignal.__slots__)
+    assert result["signals"][1]["confidence"] is None
+
+
+def test_collect_timeframe_signals_reads_slots_directive() -> None:
+    # AGIReasoningOutput memakai slots → vars(directive) dulu TypeError
+    signals = {signal.timeframe: signal for signal in engine._collect_timeframe_signals(_directive())}
+
+    assert signals["H4"].trend == "bullish"
+    assert signals["H1"].trend == "bearish"
+    assert signals["H1"].ema_bias == "down"
+    # wlwci dibaca dari atribut directive lewat view slots
+    assert all(signal.wlwci == 0.91 for signal in signals.values())
+
+
+def test_extract_fta_context_reads_slots_directive() -> None:
+    context = engine._extract_fta_context(_directive())
+
+    assert context is not None
+    assert context["swing_low"] == 1.08
+    assert context["swing_high"] == 1.12
+    # price_now tidak ada di payload → fallback ke entry_price directive
+    assert context["price_now"] == 1.1
+    assert engine._extract_fta_context(_directive(final_report_data=None)) is None
+
+
+def test_directive_mapping_is_read_only_view() -> None:
+    directive = _directive()
+    view = engine._directive_mapping(directive)
+
+    assert "pair" in view and view["wlwci"] == 0.91
+    assert "missing" not in view
+    with pytest.raises(KeyError):
+        view["missing"]
+    assert set(view) == set(engine.AGIReasoningOutput.__slots__)
+
+    class Plain:
+        def __init__(self) -> None:
+            self.pair = "GBPUSD"
+
+    assert engine._directive_mapping(Plain()) == {"pair": "GBPUSD"}
+
+
+@pytest.mark.parametrize(
+    "overrides, missing",
+    [
+        ({"entry_price": float("nan")}, 0),
+        ({"entry_price": None}, 0),
+        ({"confidence": float("nan")}, 2),
+        ({"confidence": None}, 2),
+    ],
+)
+def test_execution_candidates_reject_nan_and_none(overrides, missing) -> None:
+    # dulu entry/rc jatuh ke field directive mentah → NaN lolos, None → TypeError
+    directive = _directive(**overrides)
+    candidates = engine._execution_candidates({"price_now": 1.1}, {}, None, directive)
+
+    assert candidates[missing] is None
+    assert [value is None for index, value in enumerate(candidates) if index != missing] == [
+        False,
+        False,
+        False,
+    ]
+
+
+def test_execution_candidates_prefer_payload_values() -> None:
+    directive = _directive(wlwci=None)
+    final_data = {"entry": "1.2", "price_now": 1.19, "rc": 0.93, "wlwci": 0.97}
+
+    assert engine._execution_candidates(final_data, {}, 0.5, directive) == (1.2, 1.19, 0.93, 0.97)
+    # tanpa data payload: fallback ke core confidence, lalu field directive
+    assert engine._execution_candidates({"price_now": 1.1}, {"wlwci_adj": 0.9}, None, directive) == (
+        1.1,
+        1.1,
+        0.8,
+        0.9,
+    )
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_orchestrator import proto_agi_engine_v533 as engine  # noqa: E402
+
+
+@pytest.fixture
+def journal():
+    writer = engine._AsyncJournal(engine.PatchRegistry())
+    yield writer
+    writer.flush(timeout=5.0)
+    engine._close_journal_handles()
+
+
+def test_journal_appends_and_replaces(tmp_path, journal) -> None:
+    log = tmp_path / "fusion.jsonl"
+    report = tmp_path / "report.txt"
+
+    journal.enqueue(log, engine._dumps_line({"n": 1}))
+    journal.enqueue(log, engine._dumps_line({"n": 2}))
+    journal.replace(report, b"first")
+    journal.replace(report, b"second")
+    assert journal.flush(timeout=5.0) is True
+
+    assert [json.loads(line) for line in log.read_text().splitlines()] == [{"n": 1}, {"n": 2}]
+    assert report.read_bytes() == b"second"
+
+
+def test_journal_survives_non_oserror(tmp_path, journal) -> None:
+    good = tmp_path / "after.jsonl"
+
+    # null byte di path → ValueError di thread writer, bukan OSError
+    journal.replace(tmp_path / "bad\0name.txt", b"x")
+    assert journal.flush(timeout=5.0) is True
+    assert journal._thread is not None and journal._thread.is_alive()
+
+    journal.enqueue(good, engine._dumps_line({"ok": True}))
+    assert journal.flush(timeout=5.0) is True
+    assert json.loads(good.read_text()) == {"ok": True}
+
+
+def test_journal_restarts_dead_writer(tmp_path, journal) -> None:
+    target = tmp_path / "restart.jsonl"
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    journal._thread = dead
+
+    journal.enqueue(target, engine._dumps_line({"n": 1}))
+    assert journal.flush(timeout=5.0) is True
+    assert journal._thread.is_alive()
+    assert json.loads(target.read_text()) == {"n": 1}
+
+
+def test_journal_flush_times_out(tmp_path, journal) -> None:
+    journal._start()
+    # item tanpa task_done → flush harus kembali False, bukan menggantung
+    journal._queue.unfinished_tasks += 1
+    try:
+        assert journal.flush(timeout=0.05) is False
+    finally:
+        with journal._queue.all_tasks_done:
+            journal._queue.unfinished_tasks -= 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() tidak tersedia")
+def test_journal_usable_in_forked_child(tmp_path) -> None:
+    engine._JOURNAL.enqueue(tmp_path / "parent.jsonl", engine._dumps_line({"who": "parent"}))
+    assert engine._JOURNAL.flush(timeout=5.0) is True
+
+    child = tmp_path / "child.jsonl"
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - dijalankan di proses anak
+        ok = False
+        try:
+            engine._JOURNAL.enqueue(child, engine._dumps_line({"who": "child"}))
+            ok = engine._JOURNAL.flush(timeout=5.0)
+        finally:
+            os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert json.loads(child.read_text()) == {"who": "child"}
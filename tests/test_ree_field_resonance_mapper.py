@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_meta.ree_field_resonance_mapper import REEFieldResonanceMapper  # noqa: E402
+
+
+def _expected_state(stability: float, baseline: float) -> str:
+    if stability >= baseline:
+        return "harmonic"
+    if stability >= 0.8:
+        return "semi_harmonic"
+    return "chaotic"
+
+
+def test_exported_mapper_is_lorentzian() -> None:
+    result = REEFieldResonanceMapper().map_resonance(alpha=1.02, beta=0.97, gamma=1.11)
+
+    assert set(result) == {"resonance_index", "stability", "state", "lorentzian_phase"}
+    assert result["resonance_index"] == pytest.approx(1.035)
+    assert result["stability"] == pytest.approx(0.965)
+    assert result["state"] == "harmonic"
+
+
+@pytest.mark.parametrize("baseline", [0.9, 0.95, 0.75])
+def test_state_table_matches_threshold_cascade(baseline: float) -> None:
+    mapper = REEFieldResonanceMapper(baseline_stability=baseline)
+    rng = np.random.default_rng(7)
+    weights = rng.uniform(0.6, 1.4, size=(2_000, 3))
+
+    batch = mapper.map_resonance_batch(weights)
+    for row, stability, state in zip(weights, batch["stability"], batch["state"]):
+        scalar = mapper.map_resonance(*row)
+        assert scalar["state"] == _expected_state(scalar["stability"], baseline)
+        assert state == _expected_state(stability, baseline)
+
+
+def test_batch_state_nan_is_chaotic() -> None:
+    batch = REEFieldResonanceMapper().map_resonance_batch(np.array([[np.nan, 1.0, 1.0]]))
+    assert batch["state"].tolist() == ["chaotic"]
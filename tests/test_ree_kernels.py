@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_meta import _ree_kernels as kernels  # noqa: E402
+
+# Tanpa numba kernel harus identik dengan round() builtin; dengan numba
+# (np.around) nilai tepat di tengah boleh berbeda satu digit terakhir.
+_EXACT = not kernels._NUMBA_AVAILABLE
+_TOL = 0.0 if _EXACT else 1e-4
+
+
+def _reference_resonance(alpha: float, beta: float, gamma: float):
+    alpha, beta, gamma = (max(0.8, min(1.2, w)) for w in (alpha, beta, gamma))
+    resonance = math.sqrt((alpha**2 + beta**2 + gamma**2) / 3)
+    return (
+        round(resonance, 4),
+        round(math.sin(alpha * beta * gamma * math.pi / 2), 4),
+        round(1 - abs(1 - resonance), 4),
+    )
+
+
+def _reference_learning_gain(a: float, b: float, g: float, meta_integrity: float):
+    gain = max(0.001, 1 - ((abs(a) + abs(b) + abs(g)) * 8.5))
+    return round(gain, 4), round(meta_integrity + (gain * 0.01), 3)
+
+
+@pytest.mark.parametrize(
+    ("value", "ndigits", "expected"),
+    [(1.0005, 3, 1.0), (0.125, 2, 0.12), (2.675, 2, 2.67), (-0.125, 2, -0.12)],
+)
+@pytest.mark.skipif(not _EXACT, reason="numba memakai np.around (round-half-even terskala)")
+def test_round_matches_builtin_on_ties(value: float, ndigits: int, expected: float) -> None:
+    assert kernels._round_to(value, ndigits) == expected == round(value, ndigits)
+
+
+def test_round_keeps_nan() -> None:
+    assert math.isnan(kernels._round_to(float("nan"), 4))
+    _, delta = kernels.learning_gain_kernel(0.0, 0.0, 0.0, float("nan"))
+    assert math.isnan(delta)
+
+
+def test_resonance_kernel_matches_reference() -> None:
+    rng = random.Random(11)
+    points = [(1.0, 1.0, 1.0), (0.8, 1.2, 1.0), (0.5, 1.5, 1.0)]
+    points += [tuple(rng.uniform(0.7, 1.3) for _ in range(3)) for _ in range(5_000)]
+    for point in points:
+        assert kernels.resonance_kernel(*point) == pytest.approx(
+            _reference_resonance(*point), abs=_TOL
+        )
+
+
+def test_learning_gain_kernel_matches_reference() -> None:
+    rng = random.Random(13)
+    for _ in range(5_000):
+        args = (
+            rng.uniform(-0.05, 0.05),
+            rng.uniform(-0.05, 0.05),
+            rng.uniform(-0.05, 0.05),
+            rng.uniform(0.8, 1.0),
+        )
+        assert kernels.learning_gain_kernel(*args) == pytest.approx(
+            _reference_learning_gain(*args), abs=_TOL
+        )
@@ -1 +1,70 @@
-"""Skeleton placeholder."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_reflective import reflective_evolution_engine_v6 as ree  # noqa: E402
+
+
+class RecordingLogger:
+    def __init__(self) -> None:
+        self.entries: List[tuple[Dict[str, Any], str]] = []
+
+    def log(self, data: Dict[str, Any], category: str = "general") -> None:
+        self.entries.append((data, category))
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    events: List[tuple[str, Dict[str, Any]]] = []
+    monkeypatch.setattr(
+        ree, "log_reflective_event", lambda event, payload: events.append((event, payload))
+    )
+    instance = ree.ReflectiveEvolutionEngine(
+        history_path=tmp_path / "logs" / "ree_feedback_history.jsonl",
+        logger=RecordingLogger(),
+    )
+    instance.events = events
+    return instance
+
+
+def test_run_feedback_cycle_persists_history(engine) -> None:
+    result = engine.run_feedback_cycle(
+        pair="XAUUSD",
+        fusion_conf=0.92,
+        fundamental_score=0.81,
+        bias="BULLISH",
+        timestamp="2026-01-01T00:00:00Z",
+    )
+
+    assert result["reflective_integrity"] == pytest.approx(0.779)
+    assert result["meta_state"] == "coherent"
+    assert (result["alpha"], result["beta"], result["gamma"]) == (1.142, 0.93, 1.127)
+    assert engine.events == [("REE_FEEDBACK", result)]
+    assert engine.logger.entries[0][1] == "info"
+    assert "XAUUSD" in engine.logger.entries[0][0]["message"]
+
+    engine.close()
+    lines = engine.history_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [result]
+
+
+def test_ingest_feedback_tracks_snapshots(engine) -> None:
+    assert engine.latest_snapshot() is None
+
+    snapshot = engine.ingest_feedback(
+        {"reflective_integrity": "0.9712345", "alpha": 1.02, "gamma": "bad"}
+    )
+
+    assert engine.latest_snapshot() is snapshot
+    assert snapshot.reflective_integrity == 0.971235
+    assert snapshot.as_dict()["meta_weights"] == {"alpha": 1.02, "beta": 1.0, "gamma": 1.0}
+    assert snapshot.timestamp.endswith("Z")
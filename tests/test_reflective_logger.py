@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_reflective import _log_sink  # noqa: E402
+from core_reflective import reflective_logger  # noqa: E402
+
+
+@pytest.fixture
+def logger(tmp_path, monkeypatch):
+    monkeypatch.setattr(reflective_logger, "ROOT_LOG_DIR", tmp_path / "logs")
+    monkeypatch.setattr(reflective_logger, "VAULT_LOG_DIR", tmp_path / "vault")
+    return reflective_logger.ReflectiveLogger("clear_test")
+
+
+def test_clear_removes_jsonl_logs(logger) -> None:
+    logger.log({"n": 1})
+    _log_sink.flush_all_sinks()
+    assert json.loads(logger.log_path.read_text())["data"] == {"n": 1}
+
+    logger.clear()
+    assert not logger.log_path.exists()
+    assert not logger.vault_path.exists()
+
+
+def test_clear_removes_msgpack_logs(logger, monkeypatch) -> None:
+    # format msgpack: sink menulis ke `*.msgpack`, bukan log_path `.json`
+    monkeypatch.setattr(_log_sink, "LOG_FORMAT", "msgpack")
+    logger.log({"n": 1})
+    _log_sink.flush_all_sinks()
+    written = [logger.log_path.with_suffix(".msgpack"), logger.vault_path.with_suffix(".msgpack")]
+    assert all(path.exists() for path in written)
+
+    logger.clear()
+    assert not any(path.exists() for path in written)
+    # record tertunda tidak membuat ulang file setelah clear()
+    _log_sink.flush_all_sinks()
+    assert not any(path.exists() for path in written)
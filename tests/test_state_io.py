@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_meta._state_io import AsyncJsonSink  # noqa: E402
+
+
+def test_sink_writes_snapshot_and_appends(tmp_path) -> None:
+    sink = AsyncJsonSink()
+    snapshot = tmp_path / "state.json"
+    journal = tmp_path / "curve.jsonl"
+
+    assert sink.submit(str(snapshot), {"integrity": 0.97}) is True
+    sink.append(str(journal), {"cycle": 1})
+    sink.append(str(journal), {"cycle": 2})
+    assert sink.flush(timeout=5.0) is True
+
+    assert json.loads(snapshot.read_text()) == {"integrity": 0.97}
+    assert [json.loads(line) for line in journal.read_text().splitlines()] == [
+        {"cycle": 1},
+        {"cycle": 2},
+    ]
+    # snapshot identik dilewati (dirty-check)
+    assert sink.submit(str(snapshot), {"integrity": 0.97}) is False
+
+
+def test_sink_survives_non_oserror_and_flush_returns(tmp_path) -> None:
+    sink = AsyncJsonSink()
+    good = tmp_path / "after.jsonl"
+
+    # null byte di path → ValueError di thread sink, bukan OSError
+    sink.append(str(tmp_path / "bad\0name.jsonl"), {"cycle": 0})
+    assert sink.flush(timeout=5.0) is True
+    assert sink._thread is not None and sink._thread.is_alive()
+
+    sink.append(str(good), {"cycle": 1})
+    assert sink.flush(timeout=5.0) is True
+    assert json.loads(good.read_text()) == {"cycle": 1}
+
+
+def test_sink_restarts_dead_worker(tmp_path) -> None:
+    sink = AsyncJsonSink()
+    target = tmp_path / "state.json"
+    sink.submit(str(target), {"v": 1})
+    assert sink.flush(timeout=5.0) is True
+
+    # thread sink mati (mis. warisan fork()): objek ada tapi tidak berjalan
+    sink._thread = _dead_thread()
+    sink.submit(str(target), {"v": 2})
+    assert sink.flush(timeout=5.0) is True
+    assert json.loads(target.read_text()) == {"v": 2}
+
+
+def test_flush_times_out_instead_of_hanging(tmp_path) -> None:
+    sink = AsyncJsonSink()
+    with sink._cond:
+        sink._busy = True
+    assert sink.flush(timeout=0.05) is False
+    with sink._cond:
+        sink._busy = False
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork() tidak tersedia")
+def test_sink_usable_in_forked_child(tmp_path) -> None:
+    from core_meta._state_io import STATE_SINK
+
+    STATE_SINK.submit(str(tmp_path / "parent.json"), {"who": "parent"})
+    assert STATE_SINK.flush(timeout=5.0) is True
+
+    child = tmp_path / "child.json"
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - dijalankan di proses anak
+        ok = False
+        try:
+            STATE_SINK.submit(str(child), {"who": "child"})
+            ok = STATE_SINK.flush(timeout=5.0)
+        finally:
+            os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert json.loads(child.read_text()) == {"who": "child"}
+
+
+def test_digest_cache_is_bounded(tmp_path, monkeypatch) -> None:
+    from core_meta import _state_io
+
+    monkeypatch.setattr(_state_io, "_DIGEST_LIMIT", 8)
+    sink = AsyncJsonSink()
+    # path unik per siklus (journal sekali tulis) tidak boleh menumpuk
+    for cycle in range(50):
+        sink.submit(str(tmp_path / f"meta_cycle_{cycle}.json"), {"cycle": cycle})
+    assert sink.flush(timeout=5.0) is True
+
+    assert len(_state_io._LAST_DIGEST) <= 8
+    assert str(tmp_path / "meta_cycle_49.json") in _state_io._LAST_DIGEST
+    assert json.loads((tmp_path / "meta_cycle_0.json").read_text()) == {"cycle": 0}
+
+
+def _dead_thread():
+    import threading
+
+    thread = threading.Thread(target=lambda: None)
+    thread.start()
+    thread.join()
+    return thread
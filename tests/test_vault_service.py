@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core_meta._state_io import STATE_SINK  # noqa: E402
+from core_reflective._log_sink import flush_all_sinks  # noqa: E402
+from server_api.services.vault_service import VaultService  # noqa: E402
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    # VaultService / REE controller menulis ke path relatif (data/, quad_vaults/)
+    monkeypatch.chdir(tmp_path)
+    yield VaultService()
+    # flush sebelum cwd dikembalikan, agar log tidak tertulis ke dalam repo
+    STATE_SINK.flush(timeout=5.0)
+    flush_all_sinks()
+
+
+def test_meta_layer_reads_slots_integrity_state(service) -> None:
+    snapshot = service._evaluate_meta_layer()
+
+    state = service.ree_controller.state
+    assert snapshot["drift"] == {
+        "alpha": state.alpha_drift,
+        "beta": state.beta_drift,
+        "gamma": state.gamma_drift,
+    }
+    assert snapshot["drift_index"] == round(
+        (abs(state.alpha_drift) + abs(state.beta_drift) + abs(state.gamma_drift)) / 3, 3
+    )
+    assert snapshot["meta_integrity"] == state.integrity_index
+
+
+def test_get_status_goes_through_meta_layer(service) -> None:
+    status = service.get_status()
+
+    assert status.meta_integrity == service.ree_controller.state.integrity_index
+    assert set(status.vaults) == {"hybrid", "fx", "kartel", "journal"}